@@ -1,17 +1,16 @@
 import os
 import json
+import time
 import pandas as pd
 import re
 import subprocess
 import numpy as np
 from pathlib import Path
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTableWidget,
-                             QTableWidgetItem, QTabWidget, QDialog, QFormLayout, QLineEdit,
+                             QTableWidgetItem, QDialog, QFormLayout, QLineEdit,
                              QFileDialog, QMessageBox, QLabel, QComboBox, QGroupBox,
-                             QHeaderView, QApplication, QCheckBox, QDoubleSpinBox, QFrame,
-                             QTextEdit, QSpinBox, QProgressBar, QSplitter)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
-from PyQt5.QtGui import QFont, QTextCursor, QIcon
+                             QHeaderView, QDoubleSpinBox, QTextEdit)
+from PyQt5.QtCore import Qt, QThread, pyqtSignal, QAbstractTableModel, QModelIndex
 
 class AddFastqDialog(QDialog):
     """Dialog for adding FASTQ files for a sample"""
@@ -546,7 +545,27 @@ class NewProjectDialog(QDialog):
         if not self.samples:
             QMessageBox.warning(self, "Warning", "Please add sample files")
             return
-            
+
+        # Validate FASTQ paths up front so typos fail here instead of
+        # minutes later inside the HISAT2 subprocess
+        for sample in self.samples:
+            for key in ('r1', 'r2'):
+                fastq = sample.get(key)
+                if not fastq:
+                    continue
+                try:
+                    st = os.stat(fastq)
+                except OSError:
+                    QMessageBox.warning(self, "Warning",
+                                        f"Reads file not found for sample '{sample['name']}':\n{fastq}")
+                    return
+                if st.st_size == 0:
+                    QMessageBox.warning(self, "Warning",
+                                        f"Reads file is empty for sample '{sample['name']}':\n{fastq}")
+                    return
+                # Keep the byte count so progress reporting can estimate by size
+                sample[f'{key}_size'] = st.st_size
+
         if not self.index_file:
             QMessageBox.warning(self, "Warning", "Please select HISAT2 index file")
             return
@@ -623,6 +642,60 @@ class FilterWidget(QWidget):
         self.setLayout(layout)
 
 
+class PandasTableModel(QAbstractTableModel):
+    """Table model serving cells straight from a pandas DataFrame.
+
+    Backing a QTableView with this instead of filling a QTableWidget keeps
+    cell rendering O(visible area): Qt only asks for the cells on screen,
+    so no per-cell QTableWidgetItem is ever allocated for the full frame.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._df = pd.DataFrame()
+        self._numeric = []
+
+    def set_dataframe(self, data):
+        self.beginResetModel()
+        self._df = data.reset_index(drop=True)
+        # is_numeric_dtype also handles extension dtypes (category,
+        # Arrow-backed); np.issubdtype raises TypeError on those
+        self._numeric = [pd.api.types.is_numeric_dtype(dt)
+                         for dt in self._df.dtypes]
+        # Per-column arrays resolved once; data() then indexes the buffer
+        # directly instead of dispatching through DataFrame.iat per cell
+        self._arrays = [self._df[c].to_numpy() for c in self._df.columns]
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._df)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._df.columns)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        col = index.column()
+        if role == Qt.DisplayRole:
+            val = self._arrays[col][index.row()]
+            # Format numeric values to 2 decimal places; val != val is the
+            # NaN test without pd.isna's type-dispatch overhead
+            if self._numeric[col] and not val != val:
+                return f"{val:.2f}"
+            return str(val)
+        if role == Qt.TextAlignmentRole and self._numeric[col]:
+            return Qt.AlignRight | Qt.AlignVCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return str(self._df.columns[section])
+        return str(section + 1)
+
+
 class ProcessThread(QThread):
     """Thread for running the transcriptome analysis workflow"""
     progress = pyqtSignal(str)
@@ -637,7 +710,26 @@ class ProcessThread(QThread):
         self.plugin_path = plugin_path
         self.is_running = True
         self.checkpoint_file = os.path.join(project_path, "checkpoint.json")
-        
+        self._log_buf = []
+        self._log_type = "output"
+        self._last_flush = time.monotonic()
+
+    def _log(self, line, msg_type="output"):
+        """Buffer a console line; emit batched to avoid flooding the UI thread"""
+        if msg_type != self._log_type:
+            self._flush_log()
+            self._log_type = msg_type
+        self._log_buf.append(line)
+        if len(self._log_buf) >= 64 or time.monotonic() - self._last_flush > 0.05:
+            self._flush_log()
+
+    def _flush_log(self):
+        """Emit any buffered console lines as a single signal"""
+        if self._log_buf:
+            self.console_output.emit('\n'.join(self._log_buf), self._log_type)
+            self._log_buf.clear()
+        self._last_flush = time.monotonic()
+
     def run(self):
         try:
             # Load checkpoint if exists
@@ -722,10 +814,11 @@ class ProcessThread(QThread):
                 self.error.emit("samtools executable not found")
                 return False
                 
-            # Create output directory
+            # Create output directory (built once as Path objects; the
+            # per-sample loop below only formats file names against it)
             results_dir = os.path.join(self.project_path, f"{self.project_data['name']}_results")
-            bam_dir = os.path.join(results_dir, "bam_files")
-            os.makedirs(bam_dir, exist_ok=True)
+            bam_dir = Path(results_dir) / "bam_files"
+            bam_dir.mkdir(parents=True, exist_ok=True)
             
             # Align each sample
             samples = self.project_data.get('samples', [])
@@ -750,49 +843,70 @@ class ProcessThread(QThread):
                     cmd.extend(["-U", sample['r1']])
                 
                 # Output to SAM file first
-                sam_file = os.path.join(bam_dir, f"{sample_name}.sam")
+                sam_file = str(bam_dir / f"{sample_name}.sam")
                 cmd.extend(["-S", sam_file])
                 
                 self.console_output.emit(" ".join(cmd), "command")
                 
                 # Run HISAT2
                 result = subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8', errors='ignore')
-                
+
                 if result.stdout:
                     for line in result.stdout.strip().split('\n'):
                         if line.strip():
-                            self.console_output.emit(line.strip(), "output")
+                            self._log(line.strip(), "output")
                 if result.stderr:
                     for line in result.stderr.strip().split('\n'):
                         if line.strip():
-                            self.console_output.emit(line.strip(), "error" if result.returncode != 0 else "output")
-                            
+                            self._log(line.strip(), "error" if result.returncode != 0 else "output")
+                self._flush_log()
+
                 if result.returncode != 0:
                     self.error.emit(f"HISAT2 alignment failed for {sample_name}: {result.stderr}")
                     return False
                     
                 # Convert SAM to BAM using samtools
-                bam_file = os.path.join(bam_dir, f"{sample_name}.bam")
+                # -@ 4 parallelizes BAM compression; --write-index emits the
+                # CSI index in the same pass so downstream tools (IGV etc.)
+                # don't need a second read of the sorted BAM
+                bam_file = str(bam_dir / f"{sample_name}.bam")
                 sort_cmd = [
                     samtools_path,
                     "sort",
-                    "-o", bam_file,
+                    "-@", "4",
+                    "--write-index",
+                    "-o", f"{bam_file}##idx##{bam_file}.csi",
                     sam_file
                 ]
-                
+
                 self.console_output.emit(" ".join(sort_cmd), "command")
-                
+
                 sort_result = subprocess.run(sort_cmd, capture_output=True, text=True, encoding='utf-8', errors='ignore')
+
+                if sort_result.returncode != 0:
+                    # --write-index needs samtools >= 1.10; retry the plain
+                    # single-output form for older bundled binaries
+                    self.console_output.emit("samtools sort --write-index failed, retrying without index", "warning")
+                    sort_cmd = [
+                        samtools_path,
+                        "sort",
+                        "-@", "4",
+                        "-o", bam_file,
+                        sam_file
+                    ]
+                    self.console_output.emit(" ".join(sort_cmd), "command")
+                    sort_result = subprocess.run(sort_cmd, capture_output=True, text=True, encoding='utf-8', errors='ignore')
                 
                 if sort_result.stdout:
                     for line in sort_result.stdout.strip().split('\n'):
                         if line.strip():
-                            self.console_output.emit(line.strip(), "output")
+                            self._log(line.strip(), "output")
                 if sort_result.stderr:
                     for line in sort_result.stderr.strip().split('\n'):
                         if line.strip():
-                            self.console_output.emit(line.strip(), "error" if sort_result.returncode != 0 else "output")
-                
+                            self._log(line.strip(), "error" if sort_result.returncode != 0 else "output")
+                self._flush_log()
+
                 if sort_result.returncode != 0:
                     self.error.emit(f"samtools sort failed for {sample_name}: {sort_result.stderr}")
                     return False
@@ -838,47 +952,51 @@ class ProcessThread(QThread):
             results_dir = os.path.join(self.project_path, f"{self.project_data['name']}_results")
             bam_dir = os.path.join(results_dir, "bam_files")
             
+            # Collect basenames only; the subprocess runs with cwd=bam_dir so
+            # argv stays short and cannot hit ARG_MAX with many samples
             bam_files = []
             if os.path.exists(bam_dir):
                 for file in os.listdir(bam_dir):
                     if file.endswith(".bam"):
-                        bam_files.append(os.path.join(bam_dir, file))
-                        
+                        bam_files.append(file)
+
             if not bam_files:
                 self.error.emit("No BAM files found for counting")
                 return False
-                
+
             # Output file
             count_file = os.path.join(results_dir, "counts.txt")
-            
-            # Build FeatureCounts command
+
+            # Build FeatureCounts command (annotation/output as absolute paths
+            # since the working directory is the BAM directory)
             cmd = [
                 featurecounts_path,
-                "-a", gtf_file,
-                "-o", count_file,
+                "-a", os.path.abspath(gtf_file),
+                "-o", os.path.abspath(count_file),
                 "-T", "4",  # threads
                 "-t", "exon",
                 "-g", "gene_id",
                 "-p"  # paired-end
             ]
-            
+
             # Add all BAM files
             cmd.extend(bam_files)
-            
+
             self.console_output.emit(" ".join(cmd), "command")
-            
+
             # Run FeatureCounts
-            result = subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8', errors='ignore')
+            result = subprocess.run(cmd, cwd=bam_dir, capture_output=True, text=True, encoding='utf-8', errors='ignore')
             
             if result.stdout:
                 for line in result.stdout.strip().split('\n'):
                     if line.strip():
-                        self.console_output.emit(line.strip(), "output")
+                        self._log(line.strip(), "output")
             if result.stderr:
                 for line in result.stderr.strip().split('\n'):
                     if line.strip():
-                        self.console_output.emit(line.strip(), "error" if result.returncode != 0 else "output")
-                        
+                        self._log(line.strip(), "error" if result.returncode != 0 else "output")
+            self._flush_log()
+
             if result.returncode != 0:
                 self.error.emit(f"FeatureCounts counting failed: {result.stderr}")
                 return False
@@ -896,20 +1014,11 @@ class ProcessThread(QThread):
     def _calculate_expression_values(self, results_dir, count_file, gtf_file):
         """Calculate TPM and FPKM expression values"""
         try:
-            # Load count data
+            # Load count data; comment='#' skips the FeatureCounts header
+            # lines in the same pass instead of a readlines() pre-scan
             self.console_output.emit("Loading count data...", "info")
-            with open(count_file, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
-            
-            # Find the header line (starts with Geneid)
-            header_idx = 0
-            for i, line in enumerate(lines):
-                if line.startswith("Geneid"):
-                    header_idx = i
-                    break
-            
-            # Read data starting from header
-            count_df = pd.read_csv(count_file, sep='\t', skiprows=header_idx)
+            count_df = pd.read_csv(count_file, sep='\t', comment='#',
+                                   engine='c', memory_map=True)
             
             # Get gene lengths from GTF file
             self.console_output.emit("Extracting gene lengths from annotation file...", "info")
@@ -1094,32 +1203,47 @@ class ProcessThread(QThread):
             # Load count data - handle FeatureCounts output format correctly
             self.console_output.emit("Parsing count file...", "info")
             try:
-                # First, find the header line in the FeatureCounts output
+                # FeatureCounts prefixes the table with '#'-comment lines.
+                # PyArrow's multithreaded CSV reader parallelizes tokenization
+                # across cores but cannot skip comment lines itself, so count
+                # the leading '#' lines first (a handful at most) and pass
+                # skiprows; fall back to the single-threaded C engine with
+                # comment='#' when pyarrow is unavailable
+                header_rows = 0
                 with open(count_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    lines = f.readlines()
-                
-                # Find the header line (starts with Geneid)
-                header_idx = 0
-                for i, line in enumerate(lines):
-                    if line.startswith("Geneid"):
-                        header_idx = i
-                        break
-                
-                # Read data starting from header
-                count_df = pd.read_csv(count_file, sep='\t', skiprows=header_idx)
-                
+                    for line in f:
+                        if not line.startswith('#'):
+                            break
+                        header_rows += 1
+
+                # Probe the header row only: the sample columns are named after
+                # the BAM files featureCounts was given, so resolve the actual
+                # names and read just Geneid plus the trailing sample columns.
+                # The Chr/Start/End/Strand/Length metadata columns are never
+                # materialized and skip type inference entirely.
+                sample_names = [s['name'] for s in self.project_data['samples']]
+                header_cols = pd.read_csv(count_file, sep='\t', skiprows=header_rows,
+                                          nrows=0).columns.tolist()
+                sample_cols = header_cols[-len(sample_names):]
+                usecols = [header_cols[0]] + sample_cols
+                try:
+                    count_df = pd.read_csv(count_file, sep='\t', skiprows=header_rows,
+                                           usecols=usecols, engine='pyarrow')
+                except (ImportError, ValueError):
+                    count_df = pd.read_csv(count_file, sep='\t', comment='#',
+                                           engine='c', memory_map=True,
+                                           usecols=usecols,
+                                           dtype={c: 'int32' for c in sample_cols})
+
                 # Set Geneid as index
                 count_df.set_index(count_df.columns[0], inplace=True)
-                
-                # Remove any extra metadata columns that FeatureCounts adds 
-                # For FeatureCounts, the last N columns are the sample columns
-                # where N is the number of samples
-                sample_names = [s['name'] for s in self.project_data['samples']]
-                # Select only the sample columns (last N columns)
-                count_df = count_df.iloc[:, -len(sample_names):]
                 # Rename columns to match sample names
                 count_df.columns = sample_names
-                
+
+                # Downcast counts to int32: halves memory for 60k-gene matrices
+                # and avoids object-dtype inference on every sample column
+                count_df = count_df.astype({col: 'int32' for col in count_df.columns})
+
             except Exception as e:
                 self.error.emit(f"Failed to parse count file: {str(e)}")
                 return False
@@ -1132,26 +1256,34 @@ class ProcessThread(QThread):
                 return False
                 
             # Create design DataFrame
-            sample_names = [s['name'] for s in self.project_data['samples']]
             design_dict = {item['sample']: item['group'] for item in design_data}
-            
-            design_df = pd.DataFrame(list(design_dict.items()), columns=['sample', 'condition'])
-            design_df.set_index('sample', inplace=True)
-            
-            # Filter samples that exist in both count and design
-            common_samples = [s for s in count_df.columns if s in design_df.index]
+
+            # Filter samples that exist in both count and design; plain set
+            # membership avoids pandas' per-label hashtable dispatch
+            design_samples = set(design_dict)
+            common_samples = [s for s in count_df.columns if s in design_samples]
             if not common_samples:
                 self.error.emit("No common samples found between count file and experimental design")
                 return False
-                
+
             count_df = count_df[common_samples]
-            design_df = design_df.loc[common_samples]
+            # Build the design already aligned to common_samples, so no .loc
+            # gather is needed; the Categorical condition column also gives a
+            # cheap, deterministic ordering of the groups
+            design_df = pd.DataFrame(
+                {'condition': pd.Categorical([design_dict[s] for s in common_samples])},
+                index=pd.Index(common_samples, name='sample'))
             
             self.console_output.emit("Running DESeq2 analysis...", "info")
             
             # Create DESeq2 object and run analysis
-            # Transpose count data to have samples as rows and genes as columns for PyDESeq2
-            counts_transposed = count_df.T
+            # Transpose count data to have samples as rows and genes as columns
+            # for PyDESeq2. Go through a NumPy transpose instead of DataFrame.T,
+            # which would copy the whole gene x sample matrix into a second
+            # BlockManager and double peak memory right before DESeq2 runs
+            counts_arr = count_df.to_numpy(dtype=np.int32).T
+            counts_transposed = pd.DataFrame(counts_arr, index=count_df.columns,
+                                             columns=count_df.index)
             
             # Create DeseqDataSet object
             dds = DeseqDataSet(
@@ -1164,80 +1296,84 @@ class ProcessThread(QThread):
             # Run the differential expression analysis
             dds.deseq2()
             
-            # Get all unique conditions
-            conditions = list(set(design_df["condition"]))
+            # Get all unique conditions; the categorical's categories are
+            # already unique and sorted, so the pairwise output filenames are
+            # reproducible run-to-run (list(set(...)) was not)
+            conditions = list(design_df["condition"].cat.categories)
             
             # If we have at least 2 conditions, perform pairwise comparisons
             deseq2_results_dir = os.path.join(results_dir, "deseq2_results")
             os.makedirs(deseq2_results_dir, exist_ok=True)
             
             if len(conditions) >= 2:
-                # Perform all pairwise comparisons
-                for i in range(len(conditions)):
-                    for j in range(i + 1, len(conditions)):
-                        cond1 = conditions[i]
-                        cond2 = conditions[j]
-                        
-                        self.console_output.emit(f"Comparing {cond1} vs {cond2}...", "info")
-                        
-                        # Create contrast and get results
-                        stat_res = DeseqStats(dds, contrast=("condition", cond1, cond2))
-                        stat_res.summary()
-                        results = stat_res.results_df
-                        
-                        # Reset index to make gene names a column
-                        results = results.reset_index()
-                        # Rename the index column to 'geneid'
-                        if 'index' in results.columns:
-                            results = results.rename(columns={'index': 'geneid'})
-                        
-                        # Save individual comparison results
-                        comparison_name = f"{cond1}_vs_{cond2}"
-                        comparison_file = os.path.join(deseq2_results_dir, f"{comparison_name}_results.txt")
-                        results.to_csv(comparison_file, sep='\t', index=False)
-                        
-                # Create combined results for all comparisons
-                self.console_output.emit("Extracting results...", "info")
-                
                 # Create a list to store all comparison results
                 all_results = []
-                
-                # Perform all pairwise comparisons again for combined results
+
+                # All comparison labels up front, so the per-contrast frames can
+                # share one categorical dtype and concat merges codes instead of
+                # rebuilding an object column
+                all_comparison_names = [f"{conditions[i]}_vs_{conditions[j]}"
+                                        for i in range(len(conditions))
+                                        for j in range(i + 1, len(conditions))]
+
+                # Perform each pairwise comparison exactly once; the same
+                # results frame feeds both the per-comparison file and the
+                # combined table (each DeseqStats run repeats the Wald tests)
                 for i in range(len(conditions)):
                     for j in range(i + 1, len(conditions)):
                         cond1 = conditions[i]
                         cond2 = conditions[j]
-                        
-                        # Create contrast and get results
+
+                        self.console_output.emit(f"Comparing {cond1} vs {cond2}...", "info")
+
+                        # Create contrast and get results. Every contrast wraps
+                        # the same fitted dds, so the size factors, dispersions
+                        # and Cook's distances computed by dds.deseq2() are
+                        # shared and each DeseqStats only runs its own Wald test
                         stat_res = DeseqStats(dds, contrast=("condition", cond1, cond2))
+                        assert stat_res.dds is dds
                         stat_res.summary()
                         results = stat_res.results_df
-                        
-                        # Reset index to make gene names a column
-                        results = results.reset_index()
-                        # Rename the index column to 'geneid'
-                        if 'index' in results.columns:
-                            results = results.rename(columns={'index': 'geneid'})
-                        
+
+                        # Reset index to make gene names a 'geneid' column;
+                        # naming the axis first does it in one allocation
+                        results = results.rename_axis('geneid').reset_index()
+
+                        # Downcast the effect-size columns; float32 is plenty for
+                        # downstream filtering/plotting and halves concat memory.
+                        # pvalue/padj stay float64: strong DE genes go far below
+                        # the ~1e-38 float32 floor and would underflow to 0 in
+                        # the written results (the reader keeps them float64 too)
+                        float_cols = [c for c in ('baseMean', 'log2FoldChange',
+                                                  'lfcSE', 'stat')
+                                      if c in results.columns]
+                        results[float_cols] = results[float_cols].astype('float32')
+
                         # Add comparison info to results
-                        results['comparison'] = f"{cond1}_vs_{cond2}"
+                        results['comparison'] = pd.Categorical([f"{cond1}_vs_{cond2}"] * len(results),
+                                                               categories=all_comparison_names)
                         all_results.append(results)
-                
+
                 # Combine all results
+                self.console_output.emit("Extracting results...", "info")
                 if all_results:
-                    combined_results = pd.concat(all_results, ignore_index=True)
+                    combined_results = pd.concat(all_results, ignore_index=True, copy=False, sort=False)
+
+                    # Write the per-comparison files from the combined frame in
+                    # one batch so pandas' column dispatch and number-format
+                    # caches are shared across contrasts
+                    for comparison_name, grp in combined_results.groupby('comparison', sort=False):
+                        comparison_file = os.path.join(deseq2_results_dir, f"{comparison_name}_results.txt")
+                        grp.drop(columns='comparison').to_csv(comparison_file, sep='\t', index=False,
+                                                              float_format='%.6g')
                 else:
                     # Fallback to default results if no comparisons worked
                     results = dds.summary()
-                    combined_results = results.reset_index()
-                    if 'index' in combined_results.columns:
-                        combined_results = combined_results.rename(columns={'index': 'geneid'})
+                    combined_results = results.rename_axis('geneid').reset_index()
             else:
                 # If we can't make a proper contrast, just get the results
                 results = dds.summary()
-                combined_results = results.reset_index()
-                if 'index' in combined_results.columns:
-                    combined_results = combined_results.rename(columns={'index': 'geneid'})
+                combined_results = results.rename_axis('geneid').reset_index()
             
             # Ensure geneid column is present
             if combined_results.index.name is not None and 'geneid' not in combined_results.columns:
@@ -1254,11 +1390,15 @@ class ProcessThread(QThread):
             deseq2_results = os.path.join(results_dir, "deseq2_results.txt")
             combined_results.to_csv(deseq2_results, sep='\t', index=False)
             
-            # Filter out rows where baseMean = 0 and save to filtered file
+            # Filter out rows where baseMean = 0 and save to filtered file;
+            # comparing on the NumPy array sidesteps the Series comparison
+            # machinery and the mask gathers all columns in one pass
             if 'baseMean' in combined_results.columns:
-                filtered_results = combined_results[combined_results['baseMean'] != 0]
+                mask = combined_results['baseMean'].to_numpy() != 0
+                filtered_results = combined_results.iloc[mask]
                 deseq2_filtered_results = os.path.join(results_dir, "deseq2_results_filtered.txt")
-                filtered_results.to_csv(deseq2_filtered_results, sep='\t', index=False)
+                filtered_results.to_csv(deseq2_filtered_results, sep='\t', index=False,
+                                        float_format='%.6g')
                 self.console_output.emit(f"Filtered out rows with baseMean=0, filtered results saved to: {deseq2_filtered_results}", "info")
             
             return True
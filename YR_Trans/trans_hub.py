@@ -4,7 +4,9 @@ Manages transcriptome projects and datasets with visualization capabilities
 """
 
 import os
+import csv
 import json
+import time
 import pandas as pd
 import re
 import subprocess
@@ -14,13 +16,273 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTa
                              QTableWidgetItem, QTabWidget, QDialog, QFormLayout, QLineEdit,
                              QFileDialog, QMessageBox, QLabel, QComboBox, QGroupBox,
                              QHeaderView, QApplication, QCheckBox, QDoubleSpinBox, QFrame,
-                             QTextEdit, QSpinBox, QProgressBar, QSplitter, QGridLayout, QAction, QSizePolicy,
-                             QToolButton)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
-from PyQt5.QtGui import QFont, QTextCursor, QIcon
+                             QPlainTextEdit, QSpinBox, QProgressBar, QSplitter, QGridLayout, QAction, QSizePolicy,
+                             QToolButton, QTableView)
+from PyQt5.QtCore import Qt, QThread, pyqtSignal, QObject, QRunnable, QThreadPool, QTimer, QSettings
+from collections import deque, OrderedDict
+from PyQt5.QtGui import QFont, QIcon
 from .lg_transhub import *
 from .lg_transhubviz import *
 
+# pyarrow and polars are optional accelerators, and both are heavyweight
+# imports; they are pulled in on first use so plugin startup does not pay
+# for them when the user never loads a results file. False marks "not yet
+# attempted", None "attempted and unavailable".
+_pa = _pacsv = False
+_pl = False
+
+
+def _arrow():
+    """Import pyarrow on first use; returns (pyarrow, pyarrow.csv) or Nones
+
+    Arrow's CSV reader tokenizes in parallel across cores; results files
+    fall back to the pandas reader when it is not installed.
+    """
+    global _pa, _pacsv
+    if _pa is False:
+        try:
+            import pyarrow
+            import pyarrow.csv
+            _pa, _pacsv = pyarrow, pyarrow.csv
+        except ImportError:
+            _pa = _pacsv = None
+    return _pa, _pacsv
+
+
+def _polars():
+    """Import polars on first use, or None when unavailable
+
+    Its streaming CSV scanner keeps peak memory flat on very wide
+    matrices; purely optional, like pyarrow above.
+    """
+    global _pl
+    if _pl is False:
+        try:
+            import polars
+            _pl = polars
+        except ImportError:
+            _pl = None
+    return _pl
+
+
+# Non-workspace directories that live next to the workspaces
+_SKIP_DIRS = frozenset({'bin', 'src', '__pycache__'})
+
+
+def _scan_workspace(workspace):
+    """Yield (project_dir, project_json_path, has_checkpoint) per project
+
+    The project directory's own listing is read once, which also answers
+    the checkpoint.json probe the status display needs without a later
+    exists() call.
+    """
+    try:
+        entries = os.scandir(workspace)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+            try:
+                names = os.listdir(entry.path)
+            except OSError:
+                continue
+            if 'project.json' in names:
+                yield (entry.path,
+                       os.path.join(entry.path, 'project.json'),
+                       'checkpoint.json' in names)
+
+
+def _scan_projects(root):
+    """Scan every sibling workspace under root for projects
+
+    os.scandir serves is_dir() from directory data already in hand, so
+    the walk costs one readdir per directory instead of a stat per
+    candidate the way a glob/iterdir walk does. Workspace names in
+    _SKIP_DIRS are skipped before any descent. This discovery walk only
+    runs when no workspace registry exists yet; later refreshes read the
+    registered workspace paths directly.
+    """
+    try:
+        workspaces = os.scandir(root)
+    except OSError:
+        return
+    with workspaces:
+        for ws in workspaces:
+            if ws.name in _SKIP_DIRS or not ws.is_dir(follow_symlinks=False):
+                continue
+            yield from _scan_workspace(ws.path)
+
+
+def _git_tree_dirty(project_path):
+    """True when the working tree has changes worth committing
+
+    A porcelain status probe is far cheaper than letting 'git add .'
+    rescan the whole tree just to find nothing, and it spares the
+    commit call from failing with 'nothing to commit'.
+
+    --no-optional-locks keeps this read-only probe from taking the
+    index lock (so it never collides with a pull/push in flight) and
+    gc.auto=0 stops it from kicking off a background repack. Untracked
+    files stay included: freshly written result files are exactly what
+    the commit actions need to pick up.
+    """
+    status = subprocess.run(
+        ["git", "--no-optional-locks", "-c", "gc.auto=0",
+         "status", "--porcelain=v1", "-z"],
+        cwd=project_path,
+        capture_output=True
+    )
+    return bool(status.stdout.strip())
+
+
+def _sniff_sep(data_file):
+    """Guess the delimiter from a 64 KB prefix; tab when in doubt
+
+    Some DESeq2 pipelines emit comma- or semicolon-separated output;
+    sniffing the prefix avoids a wasted full-file parse and retry.
+    """
+    try:
+        with open(data_file, 'rb', buffering=1 << 20) as f:
+            head = f.read(65536)
+        return csv.Sniffer().sniff(head.decode('utf-8', 'replace'),
+                                   delimiters='\t,;').delimiter
+    except Exception:
+        return '\t'
+
+
+def _read_tsv(data_file, skip_rows=0, usecols=None):
+    """Read a tab-separated results file into a pandas DataFrame
+
+    usecols, when given, restricts the parse to that column subset; parse
+    time and memory drop roughly linearly with the columns skipped.
+    """
+    sep = _sniff_sep(data_file)
+    pa, pacsv = _arrow()
+    pl = _polars()
+    convert = None
+    if pacsv is not None and usecols:
+        convert = pacsv.ConvertOptions(include_columns=list(usecols))
+    # Huge count matrices: parse straight out of a memory map with Arrow's
+    # streaming reader, so there is no duplicate file buffer in process
+    # memory and page-in overlaps with parsing
+    if (pacsv is not None and os.path.basename(data_file) == "counts.txt"
+            and os.path.getsize(data_file) > (200 << 20)):
+        source = None
+        try:
+            source = pa.memory_map(data_file, 'r')
+            reader = pacsv.open_csv(
+                source,
+                parse_options=pacsv.ParseOptions(delimiter=sep),
+                read_options=pacsv.ReadOptions(use_threads=True, skip_rows=skip_rows),
+                convert_options=convert)
+            return reader.read_all().to_pandas(self_destruct=True)
+        except Exception:
+            pass
+        finally:
+            if source is not None:
+                source.close()
+    if pl is not None and os.path.getsize(data_file) > (10 << 20):
+        try:
+            lf = pl.scan_csv(data_file, separator=sep, skip_rows=skip_rows,
+                             infer_schema_length=1000)
+            if usecols:
+                lf = lf.select(list(usecols))
+            # Plain to_pandas keeps the frame numpy-backed like the other
+            # reader rungs; Arrow extension dtypes would bypass
+            # _compact_strings and feed the model/filter path frames it
+            # is not exercised against
+            return lf.collect(streaming=True).to_pandas()
+        except Exception:
+            pass
+    if pacsv is not None:
+        try:
+            table = pacsv.read_csv(
+                data_file,
+                parse_options=pacsv.ParseOptions(delimiter=sep),
+                read_options=pacsv.ReadOptions(use_threads=True, block_size=8 << 20,
+                                               skip_rows=skip_rows),
+                convert_options=convert)
+            # self_destruct frees the Arrow buffers during conversion
+            # instead of holding both copies alive
+            return table.to_pandas(self_destruct=True)
+        except Exception:
+            # Malformed files go through pandas' more permissive parser
+            pass
+    # Known output schemas let the C engine skip its dtype-inference pass;
+    # float32 also halves memory bandwidth for the filter scans
+    dtype = None
+    name = os.path.basename(data_file)
+    if 'deseq2_results' in name:
+        dtype = {'baseMean': 'float32', 'log2FoldChange': 'float32',
+                 'lfcSE': 'float32', 'stat': 'float32',
+                 'pvalue': 'float64', 'padj': 'float64'}
+    elif name == 'counts.txt':
+        header = pd.read_csv(data_file, sep=sep, nrows=0, skiprows=skip_rows)
+        meta = {'Geneid', 'Chr', 'Start', 'End', 'Strand', 'Length'}
+        dtype = {c: 'int32' for c in header.columns if c not in meta}
+    # memory_map reads straight from the page cache; low_memory=False
+    # types each column in one pass instead of chunked promotions
+    return pd.read_csv(data_file, sep=sep, skiprows=skip_rows, engine='c', dtype=dtype,
+                       usecols=usecols, memory_map=True, low_memory=False)
+
+
+def _compact_strings(df):
+    """Convert low-cardinality string columns to category dtype
+
+    Repeated labels like comparison names or chromosomes then occupy one
+    string each plus int codes instead of one PyObject* per row. The
+    column cap keeps the cardinality scan itself cheap on wide frames.
+    """
+    for c in df.select_dtypes(include='object').columns[:20]:
+        s = df[c]
+        if s.nunique(dropna=False) < 0.5 * max(len(s), 1):
+            df[c] = s.astype('category')
+    return df
+
+
+# orjson parses and serializes project.json several times faster than the
+# stdlib json module; fall back to the stdlib when it is not installed
+try:
+    import orjson
+
+    def _json_loads(buf):
+        return orjson.loads(buf)
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_loads(buf):
+        return json.loads(buf)
+
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+# Filter-tag styling, parsed once on the TransHub widget; the tags just
+# set object names instead of re-parsing these sheets per widget
+_FILTER_TAG_CSS = """
+    QFrame#filterTag {
+        background-color: #e9ecef;
+        border-radius: 15px;
+        margin: 2px;
+    }
+    QLabel#filterTagLabel {
+        color: #495057;
+    }
+    QPushButton#filterTagClose {
+        background-color: #dc3545;
+        color: white;
+        border: none;
+        border-radius: 10px;
+        font-weight: bold;
+        font-size: 12px;
+    }
+    QPushButton#filterTagClose:hover {
+        background-color: #c82333;
+    }
+"""
+
 # config PATH for Git
 plugin_path = os.path.dirname(os.path.abspath(__file__))
 git_path = os.path.join(plugin_path, "bin/git/cmd")
@@ -28,9 +290,141 @@ os.environ["PATH"] = f"{git_path};{os.environ['PATH']}"
 git_bash_path = os.path.join(plugin_path, "bin/git/bin")
 os.environ["PATH"] = f"{git_bash_path};{os.environ['PATH']}"
 
+class _LoadAnalysisWorker(QRunnable):
+    """Parse a results TSV on a pool thread and hand the frame back"""
+
+    class _Signals(QObject):
+        finished = pyqtSignal(str, object)
+        error = pyqtSignal(str, str)
+
+    def __init__(self, kind, data_file, skip_rows=0, usecols=None):
+        super().__init__()
+        self.kind = kind
+        self.data_file = data_file
+        self.skip_rows = skip_rows
+        self.usecols = usecols
+        self.signals = self._Signals()
+
+    def run(self):
+        try:
+            df = _read_tsv(self.data_file, skip_rows=self.skip_rows,
+                           usecols=self.usecols)
+            df = _compact_strings(df)
+        except Exception as e:
+            self.signals.error.emit(self.kind, str(e))
+            return
+        self.signals.finished.emit(self.kind, df)
+
+
+class _FilterWorker(QRunnable):
+    """Evaluate a filter mask over a large frame on a pool thread"""
+
+    class _Signals(QObject):
+        finished = pyqtSignal(str, object, object)
+
+    def __init__(self, kind, key, fn):
+        super().__init__()
+        self.kind = kind
+        self.key = key
+        self.fn = fn
+        self.signals = self._Signals()
+
+    def run(self):
+        try:
+            mask = self.fn()
+        except Exception:
+            # Data swapped out mid-compute; the next apply recomputes
+            return
+        self.signals.finished.emit(self.kind, self.key, mask)
+
+
+class _GitTask(QRunnable):
+    """Run a git operation on a pool thread and hand back its outcome.
+
+    Subprocess waits — seconds for a network push/pull — would otherwise
+    freeze the event loop; results land back on the GUI thread through
+    the signals.
+    """
+
+    class _Signals(QObject):
+        finished = pyqtSignal(object)
+        error = pyqtSignal(str)
+
+    def __init__(self, fn):
+        super().__init__()
+        self.fn = fn
+        self.signals = self._Signals()
+
+    def run(self):
+        try:
+            result = self.fn()
+        except Exception as e:
+            self.signals.error.emit(str(e))
+            return
+        self.signals.finished.emit(result)
+
+
+class _ProjectSaveTask(QRunnable):
+    """Write an already-serialized project.json on a pool thread.
+
+    Keeps slow (e.g. network-mounted) workspace writes off the Qt event
+    loop; failures are reported back through the error signal.
+    """
+
+    class _Signals(QObject):
+        error = pyqtSignal(str)
+
+    def __init__(self, path, payload):
+        super().__init__()
+        self.path = path
+        self.payload = payload
+        self.signals = self._Signals()
+
+    def run(self):
+        try:
+            # Re-saving an unchanged status is common (reload, re-select);
+            # skip the write entirely when the bytes already match
+            try:
+                with open(self.path, 'rb') as f:
+                    if f.read() == self.payload:
+                        return
+            except OSError:
+                pass
+            # Write-then-rename so a crash mid-write can never leave a
+            # truncated project.json behind
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(self.payload)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+
+
 class TransHub(QWidget):
     """Main transcriptome data hub widget"""
-    
+
+    # Project status mapped to (process enabled, import enabled) once, so
+    # selection events do one dict get instead of building membership lists
+    _BTN_STATE = {
+        'unprocessed': (True, False),
+        'pending': (True, False),
+        'paused': (True, False),
+        'completed': (False, True),
+    }
+
+    # Filter operator strings mapped to their NumPy ufuncs once, instead of
+    # a string-compare ladder per condition per apply
+    _FILTER_OPS = {
+        "Greater than or equal to": np.greater_equal,
+        "Greater than": np.greater,
+        "Equal to": np.equal,
+        "Less than or equal to": np.less_equal,
+        "Less than": np.less,
+    }
+
+    # Frames larger than this get their filter mask computed on the pool
+    _ASYNC_FILTER_ROWS = 50_000
+
     def __init__(self, config=None, plugin_path=None):
         super().__init__()
         self.config = config
@@ -41,13 +435,52 @@ class TransHub(QWidget):
         self.selected_project_row = -1
         self.process_thread = None
         self.project_path = None
-        
+        # Parsed results files keyed by (path, mtime); re-importing an
+        # unchanged project skips the TSV parse entirely
+        self._analysis_cache = OrderedDict()
+        # Parsed project.json dicts keyed by path, with an (mtime_ns, size)
+        # signature; refreshes only re-parse files that actually changed
+        self._project_cache = {}
+        # Columns the user filtered on in past sessions; differential loads
+        # can then skip the unused columns entirely (see _start_analysis_load)
+        self._settings = QSettings("YR-Trans", "TransHub")
+        saved = self._settings.value('differential/filter_columns') or []
+        if isinstance(saved, str):
+            saved = [saved]
+        self._last_filter_columns = set(saved)
+        # Filter debounce/cache state: rapid tag edits coalesce into one
+        # recompute, and an unchanged condition set reuses its last mask
+        self._pending_filter = {'expression': False, 'differential': False}
+        self._mask_cache = {}
+        # Numeric columns of the current frames as raw ndarrays, so the
+        # filter path skips pandas Series extraction per condition
+        self._column_np = {}
+        # Git button panels per analysis tab, built by _make_git_panel
+        self.git_panels = {}
+        # Projects with a sync in flight (realpath-keyed); a second press
+        # while one runs would race the first on .git/index.lock
+        self._syncing = set()
+        # Statuses kept as a parallel array (struct-of-arrays), so the
+        # selection/status paths index one array instead of chasing two
+        # dict lookups per row
+        self._proj_status = np.empty(0, dtype=object)
+        
+        # Console messages are queued and appended in one batch at 20 Hz;
+        # a per-line append would relayout the document every call. The
+        # queue must exist before load_projects, which logs parse failures
+        self._console_queue = deque()
+        self._console_timer = QTimer(self)
+        self._console_timer.timeout.connect(self._flush_console)
+        self._console_timer.start(50)
+
         self.init_ui()
         self.load_projects()
         
     def init_ui(self):
         main_layout = QVBoxLayout()
         self.setLayout(main_layout)
+        # One stylesheet parse covers every filter tag ever created
+        self.setStyleSheet(self.styleSheet() + _FILTER_TAG_CSS)
         
         # Title
         title_label = QLabel("YR Transcriptome Hub")
@@ -156,8 +589,15 @@ class TransHub(QWidget):
         left_layout = QVBoxLayout()
         left_widget.setLayout(left_layout)
         
-        # Data table
-        self.expression_table = QTableWidget()
+        # Data table: a view over a model backed by the DataFrame itself, so
+        # only the visible cells are ever rendered
+        self.expression_model = PandasTableModel()
+        self.expression_table = QTableView()
+        self.expression_table.setModel(self.expression_model)
+        # Size columns to content from a sample of rows, not all of them
+        header = self.expression_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        header.setResizeContentsPrecision(50)
         left_layout.addWidget(self.expression_table)
         
         # Filter section
@@ -205,59 +645,9 @@ class TransHub(QWidget):
         self.expression_filter_conditions_container.setVisible(False)
         right_layout.addWidget(self.expression_filter_conditions_container)
         
-        # Add separator line
-        separator_line1 = QFrame()
-        separator_line1.setFrameShape(QFrame.HLine)
-        separator_line1.setFrameShadow(QFrame.Sunken)
-        right_layout.addWidget(separator_line1)
-        
-        # History control label
-        history_label = QLabel("History Control (based on Git):")
-        history_label.setStyleSheet("font-weight: bold;")
-        right_layout.addWidget(history_label)
-        
-        # History control buttons
-        self.commit_icon = QIcon(os.path.join(self.plugin_path, "YR_Trans", "src", "commit.svg"))
-        self.branch_icon = QIcon(os.path.join(self.plugin_path, "YR_Trans", "src", "branch.svg"))
-        self.git_icon    = QIcon(os.path.join(self.plugin_path, "YR_Trans", "src", "git.svg"))
-        self.remote_icon = QIcon(os.path.join(self.plugin_path, "YR_Trans", "src", "remote.svg"))
-        self.back_icon   = QIcon(os.path.join(self.plugin_path, "YR_Trans", "src", "scrollback.svg"))
-        self.sync_icon   = QIcon(os.path.join(self.plugin_path, "YR_Trans", "src", "sync.svg"))
-
-        self.commit_btn2 = QPushButton("Commit to History")
-        self.commit_btn2.clicked.connect(self.commit_to_history)
-        self.commit_btn2.setIcon(self.commit_icon)
-        self.commit_new_branch_btn2 = QPushButton("Commit && New Branch")
-        self.commit_new_branch_btn2.clicked.connect(self.commit_and_new_branch)
-        self.commit_new_branch_btn2.setIcon(self.branch_icon)
-        self.manage_history_btn2 = QPushButton("Manage History")
-        self.manage_history_btn2.clicked.connect(self.manage_history)
-        self.manage_history_btn2.setIcon(self.git_icon)
-        self.rollback_btn2 = QPushButton("Scroll Back to Last History")
-        self.rollback_btn2.clicked.connect(self.rollback_to_last_commit)
-        self.rollback_btn2.setIcon(self.back_icon)
-        
-        # Separator line
-        separator = QFrame()
-        separator.setFrameShape(QFrame.HLine)
-        separator.setFrameShadow(QFrame.Sunken)
-        
-        self.configure_remote_btn2 = QPushButton("Configure Remote Repository")
-        self.configure_remote_btn2.clicked.connect(self.configure_remote_repository)
-        self.configure_remote_btn2.setIcon(self.remote_icon)
-
-        self.sync_btn2 = QPushButton("Sync to Remote")
-        self.sync_btn2.clicked.connect(self.sync_with_remote)
-        self.sync_btn2.setIcon(self.sync_icon)
-        
-        right_layout.addWidget(self.commit_btn2)
-        right_layout.addWidget(self.commit_new_branch_btn2)
-        right_layout.addWidget(self.manage_history_btn2)
-        right_layout.addWidget(self.rollback_btn2)
-        right_layout.addWidget(separator)
-        right_layout.addWidget(self.configure_remote_btn2)
-        right_layout.addWidget(self.sync_btn2)
-        
+        # Git history controls (shared builder)
+        self.git_panels['expression'] = self._make_git_panel(right_layout)
+
         # Add separator line
         separator_line2 = QFrame()
         separator_line2.setFrameShape(QFrame.HLine)
@@ -296,6 +686,59 @@ class TransHub(QWidget):
         # Set splitter sizes
         splitter.setSizes([7,3])
         
+    def _make_git_panel(self, layout):
+        """Build the Git history/remote button panel into the given layout
+
+        Both analysis tabs show the same seven controls; one builder keeps
+        them in sync and halves the construction code. The SVG icons are
+        loaded once on first use and shared between the panels.
+        """
+        if not hasattr(self, 'commit_icon'):
+            src = os.path.join(self.plugin_path, "YR_Trans", "src")
+            self.commit_icon = QIcon(os.path.join(src, "commit.svg"))
+            self.branch_icon = QIcon(os.path.join(src, "branch.svg"))
+            self.git_icon    = QIcon(os.path.join(src, "git.svg"))
+            self.remote_icon = QIcon(os.path.join(src, "remote.svg"))
+            self.back_icon   = QIcon(os.path.join(src, "scrollback.svg"))
+            self.sync_icon   = QIcon(os.path.join(src, "sync.svg"))
+
+        # Add separator line
+        separator_line = QFrame()
+        separator_line.setFrameShape(QFrame.HLine)
+        separator_line.setFrameShadow(QFrame.Sunken)
+        layout.addWidget(separator_line)
+
+        # History control label
+        history_label = QLabel("History Control (based on Git):")
+        history_label.setStyleSheet("font-weight: bold;")
+        layout.addWidget(history_label)
+
+        # History control buttons; None marks the local/remote separator
+        specs = [
+            ('commit', "Commit to History", self.commit_icon, self.commit_to_history),
+            ('branch', "Commit && New Branch", self.branch_icon, self.commit_and_new_branch),
+            ('history', "Manage History", self.git_icon, self.manage_history),
+            ('rollback', "Scroll Back to Last History", self.back_icon, self.rollback_to_last_commit),
+            None,
+            ('remote', "Configure Remote Repository", self.remote_icon, self.configure_remote_repository),
+            ('sync', "Sync to Remote", self.sync_icon, self.sync_with_remote),
+        ]
+        buttons = {}
+        for spec in specs:
+            if spec is None:
+                separator = QFrame()
+                separator.setFrameShape(QFrame.HLine)
+                separator.setFrameShadow(QFrame.Sunken)
+                layout.addWidget(separator)
+                continue
+            key, text, icon, slot = spec
+            btn = QPushButton(text)
+            btn.setIcon(icon)
+            btn.clicked.connect(slot)
+            layout.addWidget(btn)
+            buttons[key] = btn
+        return buttons
+
     def setup_differential_tab(self):
         """Setup the differential analysis tab"""
         layout = QVBoxLayout()
@@ -310,8 +753,15 @@ class TransHub(QWidget):
         left_layout = QVBoxLayout()
         left_widget.setLayout(left_layout)
         
-        # Data table
-        self.differential_table = QTableWidget()
+        # Data table: a view over a model backed by the DataFrame itself, so
+        # only the visible cells are ever rendered
+        self.differential_model = PandasTableModel()
+        self.differential_table = QTableView()
+        self.differential_table.setModel(self.differential_model)
+        # Size columns to content from a sample of rows, not all of them
+        header = self.differential_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        header.setResizeContentsPrecision(50)
         left_layout.addWidget(self.differential_table)
         
         # Filter section
@@ -336,6 +786,9 @@ class TransHub(QWidget):
         self.clear_differential_filter_btn.clicked.connect(self.clear_differential_filter_conditions)
         filter_button_layout.addWidget(self.add_differential_filter_btn)
         filter_button_layout.addWidget(self.clear_differential_filter_btn)
+        self.load_all_columns_cb = QCheckBox("Load all columns")
+        self.load_all_columns_cb.stateChanged.connect(self._on_load_all_columns_toggled)
+        filter_button_layout.addWidget(self.load_all_columns_cb)
         filter_button_layout.addStretch()
         filter_layout.addLayout(filter_button_layout)
         
@@ -359,59 +812,9 @@ class TransHub(QWidget):
         self.differential_filter_conditions_container.setVisible(False)
         right_layout.addWidget(self.differential_filter_conditions_container)
         
-        # Git history controls
-        # Add separator line
-        separator_line1 = QFrame()
-        separator_line1.setFrameShape(QFrame.HLine)
-        separator_line1.setFrameShadow(QFrame.Sunken)
-        right_layout.addWidget(separator_line1)
-        
-        # History control label
-        history_label = QLabel("History Control (based on Git):")
-        history_label.setStyleSheet("font-weight: bold;")
-        right_layout.addWidget(history_label)
-        
-        # History control buttons
-        self.commit_icon = QIcon(os.path.join(self.plugin_path, "YR_Trans", "src", "commit.svg"))
-        self.branch_icon = QIcon(os.path.join(self.plugin_path, "YR_Trans", "src", "branch.svg"))
-        self.git_icon    = QIcon(os.path.join(self.plugin_path, "YR_Trans", "src", "git.svg"))
-        self.remote_icon = QIcon(os.path.join(self.plugin_path, "YR_Trans", "src", "remote.svg"))
-        self.back_icon   = QIcon(os.path.join(self.plugin_path, "YR_Trans", "src", "scrollback.svg"))
-        self.sync_icon   = QIcon(os.path.join(self.plugin_path, "YR_Trans", "src", "sync.svg"))
-
-        self.commit_btn2 = QPushButton("Commit to History")
-        self.commit_btn2.clicked.connect(self.commit_to_history)
-        self.commit_btn2.setIcon(self.commit_icon)
-        self.commit_new_branch_btn2 = QPushButton("Commit && New Branch")
-        self.commit_new_branch_btn2.clicked.connect(self.commit_and_new_branch)
-        self.commit_new_branch_btn2.setIcon(self.branch_icon)
-        self.manage_history_btn2 = QPushButton("Manage History")
-        self.manage_history_btn2.clicked.connect(self.manage_history)
-        self.manage_history_btn2.setIcon(self.git_icon)
-        self.rollback_btn2 = QPushButton("Scroll Back to Last History")
-        self.rollback_btn2.clicked.connect(self.rollback_to_last_commit)
-        self.rollback_btn2.setIcon(self.back_icon)
-        
-        # Separator line
-        separator2 = QFrame()
-        separator2.setFrameShape(QFrame.HLine)
-        separator2.setFrameShadow(QFrame.Sunken)
-        
-        self.configure_remote_btn2 = QPushButton("Configure Remote Repository")
-        self.configure_remote_btn2.clicked.connect(self.configure_remote_repository)
-        self.configure_remote_btn2.setIcon(self.remote_icon)
-        self.sync_btn2 = QPushButton("Sync to Remote")
-        self.sync_btn2.clicked.connect(self.sync_with_remote)
-        self.sync_btn2.setIcon(self.sync_icon)
-        
-        right_layout.addWidget(self.commit_btn2)
-        right_layout.addWidget(self.commit_new_branch_btn2)
-        right_layout.addWidget(self.manage_history_btn2)
-        right_layout.addWidget(self.rollback_btn2)
-        right_layout.addWidget(separator2)
-        right_layout.addWidget(self.configure_remote_btn2)
-        right_layout.addWidget(self.sync_btn2)
-        
+        # Git history controls (shared builder)
+        self.git_panels['differential'] = self._make_git_panel(right_layout)
+
         # Add separator line
         separator_line2 = QFrame()
         separator_line2.setFrameShape(QFrame.HLine)
@@ -494,345 +897,301 @@ class TransHub(QWidget):
             viz_dialog.exec_()
         else:
             QMessageBox.warning(self, "No Data", "No differential data available for visualization.")
-    def add_expression_filter_condition(self):
-        """Add a filter condition for expression data"""
-        if not hasattr(self, 'expression_filter_conditions'):
-            self.expression_filter_conditions = []
-            
+    def _filter_ctx(self, kind):
+        """Per-kind handles for the shared filter-condition implementation
+
+        The expression and differential tabs carry identical filter UIs;
+        everything that differs between them is gathered here so the
+        add/remove/clear logic exists once.
+        """
+        if kind == 'expression':
+            return {
+                'widget': self.expression_filter_widget,
+                'layout': self.expression_filter_conditions_layout,
+                'container': self.expression_filter_conditions_container,
+                'apply': self.apply_expression_filter,
+                'remove': self.remove_expression_filter_condition,
+                'conditions_attr': 'expression_filter_conditions',
+                'tags_attr': 'expression_filter_condition_tags',
+            }
+        return {
+            'widget': self.differential_filter_widget,
+            'layout': self.differential_filter_conditions_layout,
+            'container': self.differential_filter_conditions_container,
+            'apply': self.apply_differential_filter,
+            'remove': self.remove_differential_filter_condition,
+            'conditions_attr': 'differential_filter_conditions',
+            'tags_attr': 'differential_filter_condition_tags',
+        }
+
+    def _add_filter_condition(self, kind):
+        ctx = self._filter_ctx(kind)
+        conditions = getattr(self, ctx['conditions_attr'], None)
+        if conditions is None:
+            conditions = []
+            setattr(self, ctx['conditions_attr'], conditions)
+
         # Get filter values
-        column = self.expression_filter_widget.column_combo.currentText()
-        operator = self.expression_filter_widget.operator_combo.currentText()
-        value = self.expression_filter_widget.value_spinbox.value()
-        
+        column = ctx['widget'].column_combo.currentText()
+        operator = ctx['widget'].operator_combo.currentText()
+        value = ctx['widget'].value_spinbox.value()
+
         if not column:
             QMessageBox.warning(self, "Warning", "Please select a column to filter")
             return
-            
+
         # Create condition info
         condition_info = {
             'column': column,
             'operator': operator,
             'value': value
         }
-        
-        self.expression_filter_conditions.append(condition_info)
-        
+
+        conditions.append(condition_info)
+
         # Create tag widget (similar to HISAT2 reads tags)
         tag_widget = QFrame()
         tag_widget.setFrameStyle(QFrame.Box)
-        tag_widget.setStyleSheet("""
-            QFrame {
-                background-color: #e9ecef;
-                border-radius: 15px;
-                margin: 2px;
-            }
-        """)
-        
+        tag_widget.setObjectName("filterTag")
+
         tag_layout = QHBoxLayout()
         tag_layout.setContentsMargins(8, 4, 8, 4)
         tag_widget.setLayout(tag_layout)
-        
+
         # Condition info label
         info_text = f"{column} {operator} {value}"
         info_label = QLabel(info_text)
-        info_label.setStyleSheet("color: #495057;")
+        info_label.setObjectName("filterTagLabel")
         tag_layout.addWidget(info_label)
-        
+
         # Close button
         close_btn = QPushButton("×")
         close_btn.setFixedSize(20, 20)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #dc3545;
-                color: white;
-                border: none;
-                border-radius: 10px;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #c82333;
-            }
-        """)
-        close_btn.clicked.connect(lambda: self.remove_expression_filter_condition(condition_info, tag_widget))
+        close_btn.setObjectName("filterTagClose")
+        close_btn.clicked.connect(lambda: ctx['remove'](condition_info, tag_widget))
         tag_layout.addWidget(close_btn)
-        
+
         # Add to layout
-        self.expression_filter_conditions_layout.addWidget(tag_widget)
-        if not hasattr(self, 'expression_filter_condition_tags'):
-            self.expression_filter_condition_tags = []
-        self.expression_filter_condition_tags.append((condition_info, tag_widget))
-        
+        ctx['layout'].addWidget(tag_widget)
+        tags = getattr(self, ctx['tags_attr'], None)
+        if tags is None:
+            # Keyed by widget identity so removal is one dict pop
+            tags = {}
+            setattr(self, ctx['tags_attr'], tags)
+        tags[id(tag_widget)] = (condition_info, tag_widget)
+
         # Show container
-        self.expression_filter_conditions_container.setVisible(True)
-        
+        ctx['container'].setVisible(True)
+
         # Apply filter
-        self.apply_expression_filter()
-        
-    def remove_expression_filter_condition(self, condition_info, tag_widget):
-        """Remove an expression filter condition"""
-        if hasattr(self, 'expression_filter_conditions') and condition_info in self.expression_filter_conditions:
-            self.expression_filter_conditions.remove(condition_info)
-        
-        # Remove from tags list
-        if hasattr(self, 'expression_filter_condition_tags'):
-            self.expression_filter_condition_tags = [(ci, tw) for ci, tw in self.expression_filter_condition_tags if ci != condition_info]
-        
+        ctx['apply']()
+
+    def _remove_filter_condition(self, kind, condition_info, tag_widget):
+        ctx = self._filter_ctx(kind)
+        conditions = getattr(self, ctx['conditions_attr'], None)
+        if conditions and condition_info in conditions:
+            conditions.remove(condition_info)
+
+        # Remove from tags dict
+        tags = getattr(self, ctx['tags_attr'], None)
+        if tags is not None:
+            tags.pop(id(tag_widget), None)
+
         # Remove widget
-        self.expression_filter_conditions_layout.removeWidget(tag_widget)
+        ctx['layout'].removeWidget(tag_widget)
         tag_widget.deleteLater()
-        
+
         # Hide container if no conditions left
-        if not hasattr(self, 'expression_filter_conditions') or not self.expression_filter_conditions:
-            self.expression_filter_conditions_container.setVisible(False)
-            
+        if not conditions:
+            ctx['container'].setVisible(False)
+
         # Apply filter
-        self.apply_expression_filter()
-        
-    def clear_expression_filter_conditions(self):
-        """Clear all expression filter conditions"""
-        if hasattr(self, 'expression_filter_conditions'):
-            self.expression_filter_conditions.clear()
-            
-        if hasattr(self, 'expression_filter_condition_tags'):
+        ctx['apply']()
+
+    def _clear_filter_conditions(self, kind):
+        ctx = self._filter_ctx(kind)
+        conditions = getattr(self, ctx['conditions_attr'], None)
+        if conditions is not None:
+            conditions.clear()
+
+        tags = getattr(self, ctx['tags_attr'], None)
+        if tags is not None:
             # Remove all tag widgets
-            for condition_info, tag_widget in self.expression_filter_condition_tags:
-                self.expression_filter_conditions_layout.removeWidget(tag_widget)
+            for condition_info, tag_widget in tags.values():
+                ctx['layout'].removeWidget(tag_widget)
                 tag_widget.deleteLater()
-            self.expression_filter_condition_tags.clear()
-            
+            tags.clear()
+
         # Hide container
-        self.expression_filter_conditions_container.setVisible(False)
-        
+        ctx['container'].setVisible(False)
+
         # Apply filter (this will reset the table to show all data)
-        self.apply_expression_filter()
-        
+        ctx['apply']()
+
+    def add_expression_filter_condition(self):
+        """Add a filter condition for expression data"""
+        self._add_filter_condition('expression')
+
+    def remove_expression_filter_condition(self, condition_info, tag_widget):
+        """Remove an expression filter condition"""
+        self._remove_filter_condition('expression', condition_info, tag_widget)
+
+    def clear_expression_filter_conditions(self):
+        """Clear all expression filter conditions"""
+        self._clear_filter_conditions('expression')
+
+    def _build_mask(self, df, conditions, kind=None):
+        """Combine filter conditions into one boolean mask over df
+
+        One mask plus one gather moves each row's bytes once, instead of
+        rebuilding the DataFrame per condition. Columns come from the
+        per-kind ndarray cache when it matches, so repeated applies do no
+        Series extraction at all. Unknown operators are ignored, as the
+        old if/elif ladder did.
+        """
+        cols = self._column_np.get(kind, {})
+        mask = np.ones(len(df), dtype=bool)
+        for condition in conditions:
+            op = self._FILTER_OPS.get(condition['operator'])
+            if op is None:
+                continue
+            arr = cols.get(condition['column'])
+            if arr is None or len(arr) != len(df):
+                arr = df[condition['column']].to_numpy()
+            mask &= op(arr, condition['value'])
+        return mask
+
     def apply_expression_filter(self):
-        """Apply filter to the expression data table"""
-        if not hasattr(self, 'current_expression_data') or self.current_expression_data is None:
+        """Apply filter to the expression data table (debounced)
+
+        Adding/removing several tags in quick succession schedules one
+        recompute instead of one per edit.
+        """
+        if self._pending_filter['expression']:
             return
-            
-        # Start with all data
-        filtered_data = self.current_expression_data.copy()
-        
-        # Apply each filter condition
-        if hasattr(self, 'expression_filter_conditions') and self.expression_filter_conditions:
-            for condition in self.expression_filter_conditions:
-                column = condition['column']
-                operator = condition['operator']
-                value = condition['value']
-                
-                # Apply filter based on operator
-                if operator == "Greater than or equal to":
-                    filtered_data = filtered_data[filtered_data[column] >= value]
-                elif operator == "Greater than":
-                    filtered_data = filtered_data[filtered_data[column] > value]
-                elif operator == "Equal to":
-                    filtered_data = filtered_data[filtered_data[column] == value]
-                elif operator == "Less than or equal to":
-                    filtered_data = filtered_data[filtered_data[column] <= value]
-                elif operator == "Less than":
-                    filtered_data = filtered_data[filtered_data[column] < value]
-        
-        # Update data table with filtered data
-        self.update_expression_table(filtered_data)
-        
+        self._pending_filter['expression'] = True
+        QTimer.singleShot(50, self._do_apply_expression_filter)
+
+    def _do_apply_expression_filter(self):
+        self._do_apply_filter('expression')
+
+    def _do_apply_filter(self, kind):
+        """Recompute and apply the filter for one analysis table
+
+        Small frames filter synchronously; past _ASYNC_FILTER_ROWS the
+        mask is evaluated on the pool so spinbox edits never stall the
+        event loop, and the result lands back via _on_filter_mask_ready.
+        """
+        self._pending_filter[kind] = False
+        data_attr = ('current_expression_data' if kind == 'expression'
+                     else 'current_differential_data')
+        df = getattr(self, data_attr, None)
+        if df is None:
+            return
+        update = (self.update_expression_table if kind == 'expression'
+                  else self.update_differential_table)
+
+        conditions = getattr(self, f'{kind}_filter_conditions', None)
+        if not conditions:
+            update(df)
+            return
+
+        if kind == 'differential':
+            # Remember the filtered columns so the next differential load
+            # can restrict its parse to them
+            used = {c['column'] for c in conditions}
+            if not used <= self._last_filter_columns:
+                self._last_filter_columns |= used
+                self._settings.setValue('differential/filter_columns',
+                                        sorted(self._last_filter_columns))
+
+        key = tuple((c['column'], c['operator'], c['value']) for c in conditions)
+        cached = self._mask_cache.get(kind)
+        if cached is not None and cached[0] == key and len(cached[1]) == len(df):
+            update(df[cached[1]])
+            return
+
+        if len(df) > self._ASYNC_FILTER_ROWS:
+            # Snapshot the conditions: the user may keep editing tags
+            # while the mask is computed
+            conds = [dict(c) for c in conditions]
+            worker = _FilterWorker(
+                kind, key, lambda: self._build_mask(df, conds, kind))
+            worker.signals.finished.connect(self._on_filter_mask_ready)
+            QThreadPool.globalInstance().start(worker)
+            return
+
+        mask = self._build_mask(df, conditions, kind)
+        self._mask_cache[kind] = (key, mask)
+        update(df[mask])
+
+    def _on_filter_mask_ready(self, kind, key, mask):
+        """Apply a pool-computed mask, unless the data moved underneath it"""
+        data_attr = ('current_expression_data' if kind == 'expression'
+                     else 'current_differential_data')
+        df = getattr(self, data_attr, None)
+        if df is None or len(mask) != len(df):
+            return
+        # Workers may overlap when edits come more than a debounce apart;
+        # only the mask matching the conditions as they stand now may
+        # touch the table or seed the cache, or an older worker finishing
+        # last would overwrite the newer result under a stale key
+        conditions = getattr(self, f'{kind}_filter_conditions', None) or []
+        current_key = tuple((c['column'], c['operator'], c['value'])
+                            for c in conditions)
+        if key != current_key:
+            return
+        self._mask_cache[kind] = (key, mask)
+        update = (self.update_expression_table if kind == 'expression'
+                  else self.update_differential_table)
+        update(df[mask])
+
+
     def add_differential_filter_condition(self):
         """Add a filter condition for differential data"""
-        if not hasattr(self, 'differential_filter_conditions'):
-            self.differential_filter_conditions = []
-            
-        # Get filter values
-        column = self.differential_filter_widget.column_combo.currentText()
-        operator = self.differential_filter_widget.operator_combo.currentText()
-        value = self.differential_filter_widget.value_spinbox.value()
-        
-        if not column:
-            QMessageBox.warning(self, "Warning", "Please select a column to filter")
-            return
-            
-        # Create condition info
-        condition_info = {
-            'column': column,
-            'operator': operator,
-            'value': value
-        }
-        
-        self.differential_filter_conditions.append(condition_info)
-        
-        # Create tag widget (similar to HISAT2 reads tags)
-        tag_widget = QFrame()
-        tag_widget.setFrameStyle(QFrame.Box)
-        tag_widget.setStyleSheet("""
-            QFrame {
-                background-color: #e9ecef;
-                border-radius: 15px;
-                margin: 2px;
-            }
-        """)
-        
-        tag_layout = QHBoxLayout()
-        tag_layout.setContentsMargins(8, 4, 8, 4)
-        tag_widget.setLayout(tag_layout)
-        
-        # Condition info label
-        info_text = f"{column} {operator} {value}"
-        info_label = QLabel(info_text)
-        info_label.setStyleSheet("color: #495057;")
-        tag_layout.addWidget(info_label)
-        
-        # Close button
-        close_btn = QPushButton("×")
-        close_btn.setFixedSize(20, 20)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #dc3545;
-                color: white;
-                border: none;
-                border-radius: 10px;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #c82333;
-            }
-        """)
-        close_btn.clicked.connect(lambda: self.remove_differential_filter_condition(condition_info, tag_widget))
-        tag_layout.addWidget(close_btn)
-        
-        # Add to layout
-        self.differential_filter_conditions_layout.addWidget(tag_widget)
-        if not hasattr(self, 'differential_filter_condition_tags'):
-            self.differential_filter_condition_tags = []
-        self.differential_filter_condition_tags.append((condition_info, tag_widget))
-        
-        # Show container
-        self.differential_filter_conditions_container.setVisible(True)
-        
-        # Apply filter
-        self.apply_differential_filter()
-        
+        self._add_filter_condition('differential')
+
     def remove_differential_filter_condition(self, condition_info, tag_widget):
         """Remove a differential filter condition"""
-        if hasattr(self, 'differential_filter_conditions') and condition_info in self.differential_filter_conditions:
-            self.differential_filter_conditions.remove(condition_info)
-        
-        # Remove from tags list
-        if hasattr(self, 'differential_filter_condition_tags'):
-            self.differential_filter_condition_tags = [(ci, tw) for ci, tw in self.differential_filter_condition_tags if ci != condition_info]
-        
-        # Remove widget
-        self.differential_filter_conditions_layout.removeWidget(tag_widget)
-        tag_widget.deleteLater()
-        
-        # Hide container if no conditions left
-        if not hasattr(self, 'differential_filter_conditions') or not self.differential_filter_conditions:
-            self.differential_filter_conditions_container.setVisible(False)
-            
-        # Apply filter
-        self.apply_differential_filter()
-        
+        self._remove_filter_condition('differential', condition_info, tag_widget)
+
     def clear_differential_filter_conditions(self):
         """Clear all differential filter conditions"""
-        if hasattr(self, 'differential_filter_conditions'):
-            self.differential_filter_conditions.clear()
-            
-        if hasattr(self, 'differential_filter_condition_tags'):
-            # Remove all tag widgets
-            for condition_info, tag_widget in self.differential_filter_condition_tags:
-                self.differential_filter_conditions_layout.removeWidget(tag_widget)
-                tag_widget.deleteLater()
-            self.differential_filter_condition_tags.clear()
-            
-        # Hide container
-        self.differential_filter_conditions_container.setVisible(False)
-        
-        # Apply filter (this will reset the table to show all data)
-        self.apply_differential_filter()
-        
+        self._clear_filter_conditions('differential')
+
     def apply_differential_filter(self):
-        """Apply filter to the differential data table"""
-        if not hasattr(self, 'current_differential_data') or self.current_differential_data is None:
+        """Apply filter to the differential data table (debounced)"""
+        if self._pending_filter['differential']:
             return
-            
-        # Start with all data
-        filtered_data = self.current_differential_data.copy()
-        
-        # Apply each filter condition
-        if hasattr(self, 'differential_filter_conditions') and self.differential_filter_conditions:
-            for condition in self.differential_filter_conditions:
-                column = condition['column']
-                operator = condition['operator']
-                value = condition['value']
-                
-                # Apply filter based on operator
-                if operator == "Greater than or equal to":
-                    filtered_data = filtered_data[filtered_data[column] >= value]
-                elif operator == "Greater than":
-                    filtered_data = filtered_data[filtered_data[column] > value]
-                elif operator == "Equal to":
-                    filtered_data = filtered_data[filtered_data[column] == value]
-                elif operator == "Less than or equal to":
-                    filtered_data = filtered_data[filtered_data[column] <= value]
-                elif operator == "Less than":
-                    filtered_data = filtered_data[filtered_data[column] < value]
-        
-        # Update data table with filtered data
-        self.update_differential_table(filtered_data)
-        
+        self._pending_filter['differential'] = True
+        QTimer.singleShot(50, self._do_apply_differential_filter)
+
+    def _do_apply_differential_filter(self):
+        self._do_apply_filter('differential')
+
     def update_expression_table(self, data):
         """Update expression data table with provided data"""
-        self.expression_table.setRowCount(len(data))
-        self.expression_table.setColumnCount(len(data.columns))
-        self.expression_table.setHorizontalHeaderLabels(data.columns.tolist())
-        
-        for i, row in data.iterrows():
-            for j, (col, val) in enumerate(row.items()):
-                # Format numeric values to 2 decimal places
-                if isinstance(val, (int, float)) and not pd.isna(val):
-                    formatted_val = f"{val:.2f}"
-                    item = QTableWidgetItem(formatted_val)
-                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                else:
-                    item = QTableWidgetItem(str(val))
-                    if isinstance(val, (int, float)):
-                        item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                self.expression_table.setItem(i, j, item)
-                
-        self.expression_table.resizeColumnsToContents()
-        
+        self.expression_model.set_dataframe(data)
+
     def update_differential_table(self, data):
         """Update differential data table with provided data"""
-        self.differential_table.setRowCount(len(data))
-        self.differential_table.setColumnCount(len(data.columns))
-        self.differential_table.setHorizontalHeaderLabels(data.columns.tolist())
-        
-        for i, row in data.iterrows():
-            for j, (col, val) in enumerate(row.items()):
-                # Format numeric values to 2 decimal places
-                if isinstance(val, (int, float)) and not pd.isna(val):
-                    formatted_val = f"{val:.2f}"
-                    item = QTableWidgetItem(formatted_val)
-                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                else:
-                    item = QTableWidgetItem(str(val))
-                    if isinstance(val, (int, float)):
-                        item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                self.differential_table.setItem(i, j, item)
-                
-        self.differential_table.resizeColumnsToContents()
+        self.differential_model.set_dataframe(data)
         
     def setup_console_tab(self):
         layout = QVBoxLayout()
         self.console_tab.setLayout(layout)
         
         # Console text area
-        self.console_text = QTextEdit()
+        # QPlainTextEdit appends plain text without the rich-text shaping
+        # QTextEdit.append pays per line
+        self.console_text = QPlainTextEdit()
         self.console_text.setReadOnly(True)
         self.console_text.setFont(QFont("Courier New", 9))
+        # Cap the scrollback so append cost stays bounded on long runs
+        self.console_text.setMaximumBlockCount(5000)
         # Set dark background for console like HISAT2 plugin
         self.console_text.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #272822;
                 color: #f8f8f2;
             }
@@ -851,87 +1210,174 @@ class TransHub(QWidget):
         """Create a new project"""
         dialog = NewProjectDialog(self)
         if dialog.exec_() == QDialog.Accepted:
+            self._register_workspace(dialog.workspace_path)
             self.load_projects()
             QMessageBox.information(self, "Success", "Project created successfully!")
-            
+
+    def _workspace_registry_path(self):
+        return Path(self.plugin_path) / "workspaces.json"
+
+    def _known_workspaces(self):
+        """Return registered workspace dirs, or None when nothing usable
+
+        Paths that no longer resolve are tombstoned out of the registry
+        as a side effect, so dead network mounts are probed once, not on
+        every refresh.
+        """
+        try:
+            entries = _json_loads(self._workspace_registry_path().read_bytes())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entries, list):
+            return None
+        live = [p for p in dict.fromkeys(entries) if os.path.isdir(p)]
+        if len(live) != len(entries):
+            self._save_workspace_registry(live)
+        return live or None
+
+    def _save_workspace_registry(self, workspaces):
+        try:
+            self._workspace_registry_path().write_bytes(_json_dumps(list(workspaces)))
+        except OSError:
+            pass
+
+    def _register_workspace(self, workspace):
+        """Record a workspace so later refreshes read it directly"""
+        if not workspace:
+            return
+        workspace = str(workspace)
+        known = self._known_workspaces() or []
+        if workspace not in known:
+            self._save_workspace_registry(known + [workspace])
+
+
     def load_projects(self):
         """Load existing projects"""
-        self.projects_table.setRowCount(0)
         self.projects = []
         
         # Scan for project.json files in workspace directories
         if self.plugin_path:
-            workspace_dirs = []
-            # Try to find workspace directories - this is a simplified approach
-            # In a real implementation, you might want to store known workspaces somewhere
             trans_dir = Path(self.plugin_path)
             if trans_dir.exists():
-                # Look for directories that might contain projects
-                for item in trans_dir.parent.parent.iterdir():
-                    if item.is_dir() and item.name not in ['bin', 'src', '__pycache__']:
-                        workspace_dirs.append(item)
-            
-            # For each potential workspace, look for projects
-            for workspace_dir in workspace_dirs:
-                if workspace_dir.exists():
-                    for project_dir in workspace_dir.iterdir():
-                        if project_dir.is_dir():
-                            project_json = project_dir / "project.json"
-                            if project_json.exists():
-                                try:
-                                    with open(project_json, 'r', encoding='utf-8') as f:
-                                        project_data = json.load(f)
-                                        self.projects.append({
-                                            'path': str(project_dir),
-                                            'data': project_data
-                                        })
-                                except Exception as e:
-                                    self.add_console_message(f"Loading project failed {project_dir}: {str(e)}", "error")
+                # Registered workspaces are read directly; the sibling-
+                # directory discovery walk only runs (and seeds the
+                # registry) while no registry exists yet
+                workspaces = self._known_workspaces()
+                if workspaces is not None:
+                    candidates = (proj for ws in workspaces
+                                  for proj in _scan_workspace(ws))
+                else:
+                    candidates = _scan_projects(str(trans_dir.parent.parent))
+                found_workspaces = set()
+                seen = set()
+                for project_dir, project_json, has_checkpoint in candidates:
+                    found_workspaces.add(os.path.dirname(project_dir))
+                    try:
+                        # Unchanged files are served from the cache; the
+                        # (mtime, size) signature catches rewrites without
+                        # re-parsing every project per refresh
+                        st = os.stat(project_json)
+                        sig = (st.st_mtime_ns, st.st_size)
+                        cached = self._project_cache.get(project_json)
+                        if cached is not None and cached[0] == sig:
+                            project_data = cached[1]
+                        else:
+                            with open(project_json, 'rb') as f:
+                                project_data = _json_loads(f.read())
+                            self._project_cache[project_json] = (sig, project_data)
+                        seen.add(project_json)
+                        self.projects.append({
+                            'path': project_dir,
+                            'data': project_data,
+                            # Hoisted copy of data['status'], so event
+                            # handlers skip the nested dict lookup
+                            'status': project_data.get('status', 'unknown'),
+                            # Captured during the scan, saving a per-row
+                            # exists() in the table loop
+                            'has_checkpoint': has_checkpoint
+                        })
+                    except Exception as e:
+                        self.add_console_message(f"Loading project failed {project_dir}: {str(e)}", "error")
+
+                # Drop cache entries for projects that disappeared
+                for stale in set(self._project_cache) - seen:
+                    del self._project_cache[stale]
+
+                # Seed the registry from the discovery walk so the next
+                # refresh can skip it
+                if workspaces is None and found_workspaces:
+                    self._save_workspace_registry(sorted(found_workspaces))
             
-            # Populate the table
-            self.projects_table.setRowCount(len(self.projects))
-            for i, project in enumerate(self.projects):
-                project_data = project['data']
-                name_item = QTableWidgetItem(project_data.get('name', 'Unknown'))
-                workspace_item = QTableWidgetItem(project_data.get('workspace', 'Unknown'))
-                created_item = QTableWidgetItem(project_data.get('created', 'Unknown'))
-                
-                # Determine status with checkpoint information
-                status = project_data.get('status', 'Unknown')
-                if status == 'processing':
-                    # Check if there's a checkpoint file
-                    checkpoint_file = Path(project['path']) / "checkpoint.json"
-                    if checkpoint_file.exists():
+            # Mirror the statuses into the parallel array
+            self._proj_status = np.array(
+                [p['data'].get('status', 'unknown') for p in self.projects],
+                dtype=object)
+
+            # Populate the table, updating rows in place: on a refresh most
+            # projects are unchanged, so reuse their items and only setText
+            # the cells whose text actually differs instead of reallocating
+            # five QTableWidgetItems per project. Repaints and signals are
+            # held for the whole pass so the table redraws once at the end
+            table = self.projects_table
+            # Non-editable flags computed once, not read-modify-write per item
+            flags = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+            table.setUpdatesEnabled(False)
+            table.blockSignals(True)
+            try:
+                table.setRowCount(len(self.projects))
+                for i, project in enumerate(self.projects):
+                    project_data = project['data']
+
+                    # Determine status with checkpoint information
+                    status = project_data.get('status', 'Unknown')
+                    if status == 'processing' and project.get('has_checkpoint'):
                         status = 'paused'
+
+                    values = (project_data.get('name', 'Unknown'),
+                              project_data.get('workspace', 'Unknown'),
+                              project_data.get('created', 'Unknown'),
+                              status,
+                              "0%")
+                    for j, value in enumerate(values):
+                        item = table.item(i, j)
+                        if item is None:
+                            item = QTableWidgetItem(value)
+                            item.setFlags(flags)
+                            table.setItem(i, j, item)
+                        elif item.text() != value:
+                            item.setText(value)
+            finally:
+                table.blockSignals(False)
+                table.setUpdatesEnabled(True)
+                table.viewport().update()
                 
-                status_item = QTableWidgetItem(status)
-                
-                # Make items non-editable
-                for item in [name_item, workspace_item, created_item, status_item]:
-                    item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-                
-                self.projects_table.setItem(i, 0, name_item)
-                self.projects_table.setItem(i, 1, workspace_item)
-                self.projects_table.setItem(i, 2, created_item)
-                self.projects_table.setItem(i, 3, status_item)
-                self.projects_table.setItem(i, 4, QTableWidgetItem("0%"))
-                
-    def on_project_selected(self):
-        """Handle project selection in the table"""
-        selected_items = self.projects_table.selectedItems()
-        if selected_items:
-            self.selected_project_row = selected_items[0].row()
-            # Enable process button if project is unprocessed or paused
-            project = self.projects[self.selected_project_row]
-            status = project['data'].get('status', 'unknown')
-            self.process_btn.setEnabled(status in ['unprocessed', 'pending', 'paused'])
-            # Enable import to analysis button if project is completed
-            self.import_analysis_btn.setEnabled(status == 'completed')
-        else:
-            self.selected_project_row = -1
-            self.process_btn.setEnabled(False)
-            self.import_analysis_btn.setEnabled(False)
-            
+    def _bulk_set_status(self, rows_statuses):
+        """Set status cells through the model with one layout signal
+
+        Each QTableWidgetItem.setText fires its own dataChanged; batching
+        through setData with signals blocked emits a single layoutChanged
+        no matter how many rows flip state at once.
+        """
+        model = self.projects_table.model()
+        model.blockSignals(True)
+        try:
+            for row, status in rows_statuses:
+                model.setData(model.index(row, 3), status)
+        finally:
+            model.blockSignals(False)
+        model.layoutChanged.emit()
+
+    def _save_project_json_async(self, path, data):
+        """Save project.json without blocking the UI thread"""
+        # Serialize here, while the dict is still consistent; only the
+        # blocking file write runs on the pool thread. The parse cache
+        # entry is stale the moment the rewrite lands, so drop it
+        self._project_cache.pop(str(path), None)
+        task = _ProjectSaveTask(str(path), _json_dumps(data))
+        task.signals.error.connect(
+            lambda msg: self.add_console_message(f"Saving project status failed: {msg}", "error"))
+        QThreadPool.globalInstance().start(task)
+
     def process_project(self):
         """Process the selected project through the workflow"""
         if self.selected_project_row == -1:
@@ -955,15 +1401,12 @@ class TransHub(QWidget):
         
         # Update status to processing
         project_data['status'] = 'processing'
-        self.projects_table.item(self.selected_project_row, 3).setText('processing')
+        project['status'] = 'processing'
+        self._proj_status[self.selected_project_row] = 'processing'
+        self._bulk_set_status([(self.selected_project_row, 'processing')])
         
         # Save updated project info
-        try:
-            project_json_path = Path(project_path) / "project.json"
-            with open(project_json_path, 'w', encoding='utf-8') as f:
-                json.dump(project_data, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            self.add_console_message(f"Saving project status failed: {str(e)}", "error")
+        self._save_project_json_async(Path(project_path) / "project.json", project_data)
         
         # Start processing thread
         self.process_thread = ProcessThread(project_data, project_path, self.plugin_path)
@@ -981,29 +1424,14 @@ class TransHub(QWidget):
             self.process_thread.wait()
             self.add_console_message("Processing stopped by user", "info")
         
-    def import_to_analysis(self):
-        """Import selected project to analysis tab"""
-        if self.selected_project_row == -1:
-            return
-            
-        project = self.projects[self.selected_project_row]
-        project_data = project['data']
-        project_path = project['path']
-
-        self.project_path = project_path
-        
-        # Load analysis data
-        if self.load_analysis_data(project_path):
-            self.tab_widget.setCurrentIndex(1)
-            QMessageBox.information(self, "Success", "Project data imported successfully!")
-            
     def clear_console(self):
         """Clear console text"""
         self.console_text.clear()
         
     def add_console_message(self, message, msg_type="info"):
         """Add message to console"""
-        timestamp = pd.Timestamp.now().strftime("%H:%M:%S")
+        # time.strftime avoids constructing a pandas Timestamp per log line
+        timestamp = time.strftime("%H:%M:%S")
         if msg_type == "command":
             formatted = f"[{timestamp}] $ {message}"
         elif msg_type == "error":
@@ -1012,9 +1440,22 @@ class TransHub(QWidget):
             formatted = f"[{timestamp}] WARNING: {message}"
         else:
             formatted = f"[{timestamp}] {message}"
-            
-        self.console_text.append(formatted)
-        self.console_text.moveCursor(QTextCursor.End)
+
+        self._console_queue.append(formatted)
+
+    def _flush_console(self):
+        """Append all queued console messages in one batch"""
+        if not self._console_queue:
+            return
+        batch = '\n'.join(self._console_queue)
+        self._console_queue.clear()
+        # Only follow the tail when the user is already at the bottom, so
+        # scrolling back through history survives new output
+        scrollbar = self.console_text.verticalScrollBar()
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+        self.console_text.appendPlainText(batch)
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
         
     def on_progress(self, message):
         """Handle progress updates"""
@@ -1033,16 +1474,13 @@ class TransHub(QWidget):
             # Update status to completed
             project = self.projects[self.selected_project_row]
             project['data']['status'] = 'completed'
-            self.projects_table.item(self.selected_project_row, 3).setText('completed')
+            project['status'] = 'completed'
+            self._proj_status[self.selected_project_row] = 'completed'
+            self._bulk_set_status([(self.selected_project_row, 'completed')])
             
             # Save updated project info
-            try:
-                project_json_path = Path(project['path']) / "project.json"
-                with open(project_json_path, 'w', encoding='utf-8') as f:
-                    json.dump(project['data'], f, indent=2, ensure_ascii=False)
-                self.add_console_message("Project processing completed and status saved", "info")
-            except Exception as e:
-                self.add_console_message(f"Saving project status failed: {str(e)}", "error")
+            self._save_project_json_async(Path(project['path']) / "project.json", project['data'])
+            self.add_console_message("Project processing completed and status saved", "info")
         
     def on_process_error(self, error_msg):
         """Handle process errors"""
@@ -1055,19 +1493,21 @@ class TransHub(QWidget):
             # Update status to error
             project = self.projects[self.selected_project_row]
             project['data']['status'] = 'error'
-            self.projects_table.item(self.selected_project_row, 3).setText('error')
+            project['status'] = 'error'
+            self._proj_status[self.selected_project_row] = 'error'
+            self._bulk_set_status([(self.selected_project_row, 'error')])
             
     def on_project_selected(self):
         """Handle project selection in the table"""
         selected_items = self.projects_table.selectedItems()
         if selected_items:
             self.selected_project_row = selected_items[0].row()
-            # Enable process button if project is unprocessed or paused
-            project = self.projects[self.selected_project_row]
-            status = project['data'].get('status', 'unknown')
-            self.process_btn.setEnabled(status in ['unprocessed', 'pending', 'paused'])
-            # Enable import to analysis button if project is completed
-            self.import_analysis_btn.setEnabled(status == 'completed')
+            # Enable process button if project is unprocessed or paused,
+            # import if completed
+            status = self._proj_status[self.selected_project_row]
+            process_enabled, import_enabled = self._BTN_STATE.get(status, (False, False))
+            self.process_btn.setEnabled(process_enabled)
+            self.import_analysis_btn.setEnabled(import_enabled)
         else:
             self.selected_project_row = -1
             self.process_btn.setEnabled(False)
@@ -1088,28 +1528,160 @@ class TransHub(QWidget):
             self.tab_widget.setCurrentIndex(1)  # Analysis tab
             QMessageBox.information(self, "Success", f"Project '{project_data['name']}' imported to analysis area")
             
-    def load_analysis_data(self, project_path, exptype='tpm'):
-        """Load analysis data for visualization"""
+    def _start_analysis_load(self, kind, data_file, skip_rows=0):
+        """Load a results TSV for the given panel ('expression'/'differential')
+
+        Cache hits land synchronously. On a miss, only the header row is
+        read here — enough to fill the filter combo — and the full parse
+        runs on the pool, so the import click never stalls on file size.
+
+        Differential loads are trimmed to the columns the user filtered on
+        in past sessions (plus the columns the UI itself depends on); the
+        "Load all columns" checkbox opts back into the full file.
+        """
+        usecols = None
+        if (kind == 'differential' and self._last_filter_columns
+                and not self.load_all_columns_cb.isChecked()):
+            header_cols = pd.read_csv(data_file, sep='\t', nrows=0,
+                                      skiprows=skip_rows).columns
+            # Besides the default filter columns, the volcano dialog
+            # requires pvalue by name and the per-contrast views key on
+            # comparison, so those must survive the trim too
+            wanted = self._last_filter_columns | {
+                'id', 'padj', 'log2FoldChange', 'pvalue', 'comparison'}
+            # The gene id column always rides along, whatever it is named
+            keep = [header_cols[0]] + [c for c in header_cols[1:] if c in wanted]
+            if len(keep) < len(header_cols):
+                usecols = keep
+        if kind == 'differential':
+            self._differential_source = (data_file, skip_rows)
+        key = (data_file, os.path.getmtime(data_file),
+               tuple(usecols) if usecols else None)
+        df = self._analysis_cache.get(key)
+        if df is not None:
+            self._analysis_cache.move_to_end(key)
+            # Shallow copy: callers get their own frame object without
+            # duplicating the column data
+            self._finish_analysis_load(kind, df.copy(deep=False))
+            return
+
+        header = pd.read_csv(data_file, sep='\t', nrows=0, skiprows=skip_rows)
+        combo = (self.expression_filter_widget.column_combo if kind == 'expression'
+                 else self.differential_filter_widget.column_combo)
+        combo.blockSignals(True)
+        try:
+            combo.clear()
+            combo.addItems([*header.columns])
+        finally:
+            combo.blockSignals(False)
+
+        worker = _LoadAnalysisWorker(kind, data_file, skip_rows, usecols=usecols)
+        worker.signals.finished.connect(
+            lambda k, frame, key=key: self._on_analysis_parsed(k, frame, key))
+        worker.signals.error.connect(self._on_analysis_load_error)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_analysis_parsed(self, kind, df, key):
+        """Cache a frame parsed off-thread and land it in the UI"""
+        self._analysis_cache[key] = df
+        # LRU cap: a handful of frames covers tab-switching between a
+        # few projects without pinning every import in memory
+        if len(self._analysis_cache) > 4:
+            self._analysis_cache.popitem(last=False)
+        self._finish_analysis_load(kind, df.copy(deep=False))
+
+    def _on_analysis_load_error(self, kind, msg):
+        QMessageBox.warning(self, "Warning", f"Failed to load {kind} data: {msg}")
+
+    def _on_load_all_columns_toggled(self, _state):
+        """Re-load the current differential file under the new column policy"""
+        source = getattr(self, '_differential_source', None)
+        if source is not None:
+            self._start_analysis_load('differential', *source)
+
+    def _finish_analysis_load(self, kind, df):
+        """Land a parsed frame in the table, combo and filter state"""
+        if kind == 'expression':
+            combo = self.expression_filter_widget.column_combo
+            table = self.expression_table
+        else:
+            combo = self.differential_filter_widget.column_combo
+            table = self.differential_table
+        # Hold combo signals and table repaints while the new frame lands,
+        # so the clear/addItems pair and the filter reset don't each
+        # trigger their own refresh
+        # New data invalidates any mask computed against the old frame;
+        # the numeric columns are re-cached as ndarrays for the filter path
+        self._mask_cache.pop(kind, None)
+        # is_numeric_dtype, unlike np.issubdtype, also understands pandas
+        # extension dtypes (category from _compact_strings, Arrow-backed
+        # columns) instead of raising TypeError on them
+        self._column_np[kind] = {
+            c: df[c].to_numpy() for c, dt in df.dtypes.items()
+            if pd.api.types.is_numeric_dtype(dt)}
+        combo.blockSignals(True)
+        table.setUpdatesEnabled(False)
+        try:
+            if kind == 'expression':
+                self.current_expression_data = df
+                self.update_expression_table(df)
+            else:
+                self.current_differential_data = df
+                self.update_differential_table(df)
+
+            # Update filter widget with column names; unpacking the Index
+            # iterates the labels directly instead of going through
+            # tolist()'s numpy object-array detour
+            combo.clear()
+            combo.addItems([*df.columns])
+
+            # Clear any existing filter conditions
+            if kind == 'expression':
+                self.clear_expression_filter_conditions()
+            else:
+                self.clear_differential_filter_conditions()
+        finally:
+            combo.blockSignals(False)
+            table.setUpdatesEnabled(True)
+            table.viewport().update()
+
+    def load_analysis_data(self, project_path, exptype='tpm',
+                           reload_expression=True, reload_differential=True):
+        """Load analysis data for visualization
+
+        The reload flags let callers that know which backing files changed
+        (e.g. rollback) skip re-parsing the untouched table.
+        """
         try:
         # if True:
-            # Look for results files
-            results_dir = os.path.join(project_path, f"{os.path.basename(project_path)}_results")
-            
-            # Load expression level data (TPM/FPKM files)
+            # Look for results files; resolve the directory once with
+            # pathlib instead of re-running basename/join string parsing
+            # for every candidate path
+            project_dir = Path(project_path)
+            results_dir = project_dir / f"{project_dir.name}_results"
+
+            # One scandir pass records the expression files and which of the
+            # fixed result files exist, replacing a listdir plus one stat
+            # syscall per exists() probe
             expression_files = []
-            if os.path.exists(results_dir):
-                for file in os.listdir(results_dir):
-                    if ((file.endswith("_tpm.txt") or file.endswith("_fpkm.txt") or 
-                        file.endswith("_tpm_filtered.txt") or file.endswith("_fpkm_filtered.txt"))):
-                        expression_files.append(os.path.join(results_dir, file))
-            
+            present = set()
+            if results_dir.is_dir():
+                with os.scandir(results_dir) as entries:
+                    for entry in entries:
+                        file = entry.name
+                        if file in ("deseq2_results_filtered.txt", "deseq2_results.txt",
+                                    "counts.txt"):
+                            present.add(file)
+                        elif file.endswith(("_tpm.txt", "_fpkm.txt",
+                                            "_tpm_filtered.txt", "_fpkm_filtered.txt")):
+                            expression_files.append(str(results_dir / file))
 
             # Load differential analysis data (DESeq2 results)
-            deseq2_filtered_file = os.path.join(results_dir, "deseq2_results_filtered.txt")
-            deseq2_file = os.path.join(results_dir, "deseq2_results.txt")
-            
+            deseq2_filtered_file = str(results_dir / "deseq2_results_filtered.txt")
+            deseq2_file = str(results_dir / "deseq2_results.txt")
+
             # Load count data as fallback
-            count_file = os.path.join(results_dir, "counts.txt")
+            count_file = str(results_dir / "counts.txt")
 
             # Load expression data (prefer filtered versions)
             expression_data_file = None
@@ -1117,74 +1689,62 @@ class TransHub(QWidget):
                 if exptype in file and "filtered" in file:
                     expression_data_file = file
                     break
-                
-            if not expression_data_file and os.path.exists(count_file):
+
+            if not expression_data_file and "counts.txt" in present:
                 expression_data_file = count_file
-                
+
             # Load differential data (prefer filtered DESeq2 results)
             differential_data_file = None
-            if os.path.exists(deseq2_filtered_file):
+            if "deseq2_results_filtered.txt" in present:
                 differential_data_file = deseq2_filtered_file
-            elif os.path.exists(deseq2_file):
+            elif "deseq2_results.txt" in present:
                 differential_data_file = deseq2_file
-            elif os.path.exists(count_file):
+            elif "counts.txt" in present:
                 differential_data_file = count_file
                 
-            # Load expression data if available
-            if expression_data_file and os.path.exists(expression_data_file):
+            # Load expression data if available; every candidate path came
+            # out of the scandir pass, so no second stat is needed
+            if not reload_expression:
+                pass
+            elif expression_data_file:
                 try:
                 # if True:
-                    with open(count_file, 'r', encoding='utf-8', errors='ignore') as f:
-                        lines = f.readlines()
-            
-                    # Find the header line (starts with Geneid)
+                    # Find the header line (starts with Geneid); stream the
+                    # file instead of materializing the whole count matrix
+                    # with readlines just to locate one line near the top
                     header_idx = 0
-                    for i, line in enumerate(lines):
-                        if line.startswith("Geneid"):
-                            header_idx = i
-                            break
-                    expression_df = pd.read_csv(expression_data_file, sep='\t', skiprows=header_idx)
-                    self.current_expression_data = expression_df
-                    self.update_expression_table(expression_df)
-                    
-                    # Update filter widget with column names
-                    self.expression_filter_widget.column_combo.clear()
-                    self.expression_filter_widget.column_combo.addItems(expression_df.columns.tolist())
-                    
-                    # Clear any existing filter conditions
-                    self.clear_expression_filter_conditions()
+                    with open(count_file, 'r', encoding='utf-8', errors='ignore') as f:
+                        for i, line in enumerate(f):
+                            if line.startswith("Geneid"):
+                                header_idx = i
+                                break
+                    self._start_analysis_load('expression', expression_data_file,
+                                              skip_rows=header_idx)
                 except Exception as e:
                     QMessageBox.warning(self, "Warning", f"Failed to load expression data: {str(e)}")
             else:
                 # Clear expression table
-                self.expression_table.setRowCount(0)
-                self.expression_table.setColumnCount(0)
+                self.expression_model.set_dataframe(pd.DataFrame())
                 self.current_expression_data = None
             
             # Load differential data if available
-            if differential_data_file and os.path.exists(differential_data_file):
+            if not reload_differential:
+                pass
+            elif differential_data_file:
                 try:
-                    differential_df = pd.read_csv(differential_data_file, sep='\t')
-                    self.current_differential_data = differential_df
-                    self.update_differential_table(differential_df)
-                    
-                    # Update filter widget with column names
-                    self.differential_filter_widget.column_combo.clear()
-                    self.differential_filter_widget.column_combo.addItems(differential_df.columns.tolist())
-                    
-                    # Clear any existing filter conditions
-                    self.clear_differential_filter_conditions()
+                    self._start_analysis_load('differential', differential_data_file)
                 except Exception as e:
                     QMessageBox.warning(self, "Warning", f"Failed to load differential data: {str(e)}")
             else:
                 # Clear differential table
-                self.differential_table.setRowCount(0)
-                self.differential_table.setColumnCount(0)
+                self.differential_model.set_dataframe(pd.DataFrame())
                 self.current_differential_data = None
                 
-            # If neither data type is available, show warning
-            if not (expression_data_file and os.path.exists(expression_data_file)) and \
-               not (differential_data_file and os.path.exists(differential_data_file)):
+            # If neither data type is available, show warning (only
+            # meaningful on a full load; partial reloads found their
+            # target file via the rollback diff)
+            if (reload_expression and reload_differential
+                    and not expression_data_file and not differential_data_file):
                 QMessageBox.warning(self, "Warning", "No analyzable data file found")
                 return False
                 
@@ -1198,7 +1758,16 @@ class TransHub(QWidget):
         if self.current_data is not None:
             path, _ = QFileDialog.getSaveFileName(self, "Export Data", "", "CSV Files (*.csv)")
             if path:
-                self.current_data.to_csv(path, index=False)
+                # Arrow's C++ CSV writer skips the per-cell Python formatting
+                # that dominates DataFrame.to_csv on large exports
+                try:
+                    pa, pacsv = _arrow()
+                    if pacsv is None:
+                        raise ImportError("pyarrow not available")
+                    pacsv.write_csv(pa.Table.from_pandas(self.current_data, preserve_index=False),
+                                    path)
+                except Exception:
+                    self.current_data.to_csv(path, index=False)
                 QMessageBox.information(self, "Success", f"Data exported to: {path}")
                 
     def reset_filter(self):
@@ -1206,6 +1775,22 @@ class TransHub(QWidget):
         # Implementation would reset filters and show all data
         pass
         
+    def _run_git_async(self, fn, on_done, error_prefix="Git operation failed",
+                       on_error=None):
+        """Dispatch a git operation to the global pool
+
+        fn runs off the GUI thread; on_done receives its return value back
+        on the GUI thread, and failures surface as a critical box (or via
+        on_error when given).
+        """
+        task = _GitTask(fn)
+        task.signals.finished.connect(on_done)
+        if on_error is None:
+            on_error = lambda msg: QMessageBox.critical(
+                self, "Error", f"{error_prefix}: {msg}")
+        task.signals.error.connect(on_error)
+        QThreadPool.globalInstance().start(task)
+
     def commit_to_history(self):
         """Commit current state to Git history"""
         dialog = CommitDialog(self, "Commit to History", "Analysis results update")
@@ -1215,29 +1800,33 @@ class TransHub(QWidget):
             if not commit_message:
                 QMessageBox.warning(self, "Warning", "Please enter a commit message")
                 return
-                
+
             # Get current project path
             if self.selected_project_row >= 0:
                 project = self.projects[self.selected_project_row]
                 project_path = project['path']
-                
-                try:
-                    # Stage all changes
+
+                def work():
+                    if not _git_tree_dirty(project_path):
+                        return False
+                    # Stage all changes, then commit
                     subprocess.run(["git", "add", "."], cwd=project_path, check=True, capture_output=True)
-                    
-                    # Commit
                     subprocess.run(
-                        ["git", "commit", "-m", commit_message], 
-                        cwd=project_path, 
-                        check=True, 
+                        ["git", "commit", "-m", commit_message],
+                        cwd=project_path,
+                        check=True,
                         capture_output=True
                     )
-                    
-                    QMessageBox.information(self, "Success", "Changes committed successfully!")
-                except subprocess.CalledProcessError as e:
-                    QMessageBox.critical(self, "Error", f"Failed to commit changes: {e}")
-                except Exception as e:
-                    QMessageBox.critical(self, "Error", f"An error occurred: {str(e)}")
+                    return True
+
+                def done(committed):
+                    if committed:
+                        QMessageBox.information(self, "Success", "Changes committed successfully!")
+                    else:
+                        QMessageBox.information(self, "Info", "No changes to commit")
+
+                self._run_git_async(work, done,
+                                    error_prefix="Failed to commit changes")
             else:
                 QMessageBox.warning(self, "Warning", "No project selected")
                 
@@ -1261,32 +1850,36 @@ class TransHub(QWidget):
             if self.selected_project_row >= 0:
                 project = self.projects[self.selected_project_row]
                 project_path = project['path']
-                
-                try:
-                    # Stage all changes
+
+                def work():
+                    if not _git_tree_dirty(project_path):
+                        return False
+                    # Stage all changes, branch, then commit
                     subprocess.run(["git", "add", "."], cwd=project_path, check=True, capture_output=True)
-                    
-                    # Create and switch to new branch
                     subprocess.run(
-                        ["git", "checkout", "-b", branch_name], 
-                        cwd=project_path, 
-                        check=True, 
+                        ["git", "checkout", "-b", branch_name],
+                        cwd=project_path,
+                        check=True,
                         capture_output=True
                     )
-                    
-                    # Commit
                     subprocess.run(
-                        ["git", "commit", "-m", commit_message], 
-                        cwd=project_path, 
-                        check=True, 
+                        ["git", "commit", "-m", commit_message],
+                        cwd=project_path,
+                        check=True,
                         capture_output=True
                     )
-                    
-                    QMessageBox.information(self, "Success", f"Changes committed and new branch '{branch_name}' created!")
-                except subprocess.CalledProcessError as e:
-                    QMessageBox.critical(self, "Error", f"Failed to commit and create branch: {e}")
-                except Exception as e:
-                    QMessageBox.critical(self, "Error", f"An error occurred: {str(e)}")
+                    return True
+
+                def done(committed):
+                    if committed:
+                        QMessageBox.information(
+                            self, "Success",
+                            f"Changes committed and new branch '{branch_name}' created!")
+                    else:
+                        QMessageBox.information(self, "Info", "No changes to commit")
+
+                self._run_git_async(work, done,
+                                    error_prefix="Failed to commit and create branch")
             else:
                 QMessageBox.warning(self, "Warning", "No project selected")
                 
@@ -1330,30 +1923,66 @@ class TransHub(QWidget):
             )
             
             if reply == QMessageBox.Yes:
-                try:
+                def work():
                     # Perform git reset --hard to rollback to last commit
                     result = subprocess.run(
-                        ["git", "reset", "--hard", "HEAD~1"], 
-                        cwd=project_path, 
-                        capture_output=True, 
+                        ["git", "reset", "--hard", "HEAD~1"],
+                        cwd=project_path,
+                        capture_output=True,
                         text=True,
                         encoding='utf-8',
                         errors='ignore'
                     )
-                    
+                    changed = None
+                    if result.returncode == 0:
+                        # Ask git which files the rollback actually touched
+                        # so unchanged tables are not re-parsed; the reflog
+                        # entry HEAD@{1} is the pre-reset position
+                        diff = subprocess.run(
+                            ["git", "diff", "--name-only", "HEAD@{1}", "HEAD"],
+                            cwd=project_path,
+                            capture_output=True,
+                            text=True,
+                            encoding='utf-8',
+                            errors='ignore'
+                        )
+                        if diff.returncode == 0:
+                            changed = diff.stdout.splitlines()
+                    return result, changed
+
+                def done(payload):
+                    result, changed = payload
                     if result.returncode == 0:
                         QMessageBox.information(self, "Success", "Rolled back to the previous commit successfully!")
-                        
-                        # Reload data and refresh tables
-                        self.load_analysis_data(project_path)
-                        
-                        # Clear all filters
-                        self.clear_expression_filter_conditions()
-                        self.clear_differential_filter_conditions()
+
+                        reload_exp = reload_diff = True
+                        if changed is not None:
+                            # counts.txt is a fallback source for both tables
+                            names = [p.rsplit('/', 1)[-1] for p in changed]
+                            reload_exp = any(
+                                n == "counts.txt" or n.endswith(
+                                    ("_tpm.txt", "_fpkm.txt",
+                                     "_tpm_filtered.txt", "_fpkm_filtered.txt"))
+                                for n in names)
+                            reload_diff = any(
+                                n == "counts.txt" or n.startswith("deseq2_results")
+                                for n in names)
+
+                        # Reload data, refresh tables and drop filters only
+                        # for the tables the rollback touched
+                        if reload_exp or reload_diff:
+                            self.load_analysis_data(project_path,
+                                                    reload_expression=reload_exp,
+                                                    reload_differential=reload_diff)
+                        if reload_exp:
+                            self.clear_expression_filter_conditions()
+                        if reload_diff:
+                            self.clear_differential_filter_conditions()
                     else:
                         QMessageBox.critical(self, "Error", f"Failed to rollback: {result.stderr}")
-                except Exception as e:
-                    QMessageBox.critical(self, "Error", f"An error occurred during rollback: {str(e)}")
+
+                self._run_git_async(work, done,
+                                    error_prefix="An error occurred during rollback")
         else:
             QMessageBox.warning(self, "Warning", "No project selected")
             
@@ -1386,169 +2015,199 @@ class TransHub(QWidget):
                 remote_url = dialog.remote_url_edit.text().strip()
                 
                 if remote_url:
-                    try:
-                        # Remove existing remote if it exists
-                        subprocess.run(
-                            ["git", "remote", "remove", "origin"], 
-                            cwd=project_path, 
-                            capture_output=True
-                        )
-                    except Exception:
-                        pass  # Ignore errors if remote doesn't exist
-                    
-                    # Add new remote
-                    try:
+                    def work():
+                        # set-url updates an existing origin in one process;
+                        # fall back to add when no origin exists yet
                         result = subprocess.run(
-                            ["git", "remote", "add", "origin", remote_url], 
-                            cwd=project_path, 
-                            capture_output=True, 
+                            ["git", "remote", "set-url", "origin", remote_url],
+                            cwd=project_path,
+                            capture_output=True,
                             text=True,
                             encoding='utf-8',
                             errors='ignore'
                         )
-                        
+                        if result.returncode != 0:
+                            result = subprocess.run(
+                                ["git", "remote", "add", "origin", remote_url],
+                                cwd=project_path,
+                                capture_output=True,
+                                text=True,
+                                encoding='utf-8',
+                                errors='ignore'
+                            )
+                        return result
+
+                    def done(result):
                         if result.returncode == 0:
                             # Save remote URL to project data
                             project_data['remote_url'] = remote_url
-                            try:
-                                project_json_path = Path(project_path) / "project.json"
-                                with open(project_json_path, 'w', encoding='utf-8') as f:
-                                    json.dump(project_data, f, indent=2, ensure_ascii=False)
-                                QMessageBox.information(self, "Success", "Remote repository configured successfully!")
-                            except Exception as e:
-                                QMessageBox.warning(self, "Warning", f"Remote added to Git but failed to save to project file: {str(e)}")
+                            self._save_project_json_async(
+                                Path(project_path) / "project.json", project_data)
+                            QMessageBox.information(self, "Success", "Remote repository configured successfully!")
                         else:
                             QMessageBox.critical(self, "Error", f"Failed to configure remote repository: {result.stderr}")
-                    except Exception as e:
-                        QMessageBox.critical(self, "Error", f"An error occurred: {str(e)}")
+
+                    self._run_git_async(work, done,
+                                        error_prefix="An error occurred")
                 else:
                     # If no URL provided, just remove existing remote
-                    try:
+                    def work():
                         subprocess.run(
-                            ["git", "remote", "remove", "origin"], 
-                            cwd=project_path, 
+                            ["git", "remote", "remove", "origin"],
+                            cwd=project_path,
                             capture_output=True
                         )
+
+                    def done(_result):
                         # Remove remote URL from project data
                         if 'remote_url' in project_data:
                             del project_data['remote_url']
-                            try:
-                                project_json_path = Path(project_path) / "project.json"
-                                with open(project_json_path, 'w', encoding='utf-8') as f:
-                                    json.dump(project_data, f, indent=2, ensure_ascii=False)
-                            except Exception as e:
-                                QMessageBox.warning(self, "Warning", f"Failed to update project file: {str(e)}")
+                            self._save_project_json_async(
+                                Path(project_path) / "project.json", project_data)
                         QMessageBox.information(self, "Success", "Remote repository removed successfully!")
-                    except Exception:
-                        QMessageBox.information(self, "Info", "No remote repository configured.")
+
+                    self._run_git_async(
+                        work, done,
+                        on_error=lambda _msg: QMessageBox.information(
+                            self, "Info", "No remote repository configured."))
         else:
             QMessageBox.warning(self, "Warning", "No project selected")
             
     def sync_with_remote(self):
-        """Sync with remote repository (pull & push)"""
-        if self.selected_project_row >= 0:
-            project = self.projects[self.selected_project_row]
-            project_path = project['path']
-            
-            try:
-                # Check if remote is configured
-                result = subprocess.run(
-                    ["git", "remote"], 
-                    cwd=project_path, 
-                    capture_output=True, 
-                    text=True,
-                    encoding='utf-8',
-                    errors='ignore'
-                )
-                
-                if result.returncode != 0 or not result.stdout.strip():
-                    QMessageBox.warning(self, "Warning", "No remote repository configured. Please configure a remote repository first.")
-                    return
-                    
-                # First, pull changes from remote
-                self.add_console_message("Pulling changes from remote repository...", "info")
-                pull_result = subprocess.run(
-                    ["git", "pull"], 
-                    cwd=project_path, 
-                    capture_output=True, 
-                    text=True,
-                    encoding='utf-8',
-                    errors='ignore'
-                )
-                
-                if pull_result.returncode != 0:
-                    # Handle pull errors (especially merge conflicts)
-                    if "conflict" in pull_result.stderr.lower() or "conflict" in pull_result.stdout.lower():
-                        QMessageBox.critical(self, "Merge Conflict", 
-                                           "Merge conflict detected during pull. Please resolve conflicts manually using Git tools.")
-                        self.add_console_message("Merge conflict detected during pull. Please resolve manually.", "error")
-                        return
-                    else:
-                        QMessageBox.warning(self, "Pull Warning", f"Failed to pull changes: {pull_result.stderr}")
-                        self.add_console_message(f"Failed to pull changes: {pull_result.stderr}", "warning")
-                
-                self.add_console_message("Pull completed successfully", "info")
-                
+        """Sync with remote repository (pull & push)
+
+        The pull/push round-trips run on the pool; the worker reports
+        progress through the console queue and returns the message boxes
+        to show, which the completion slot raises on the GUI thread.
+        """
+        if self.selected_project_row < 0:
+            QMessageBox.warning(self, "Warning", "No project selected")
+            return
+
+        project = self.projects[self.selected_project_row]
+        project_path = project['path']
+
+        # One sync per repository at a time; both the check and the
+        # add/discard run on the GUI thread, so no further locking needed
+        sync_key = os.path.realpath(project_path)
+        if sync_key in self._syncing:
+            self.add_console_message("Sync already in progress for this project", "warning")
+            return
+        self._syncing.add(sync_key)
+
+        def work():
+            boxes = []
+
+            # Check if remote is configured
+            result = subprocess.run(
+                ["git", "remote"],
+                cwd=project_path,
+                capture_output=True,
+                text=True,
+                encoding='utf-8',
+                errors='ignore'
+            )
+
+            if result.returncode != 0 or not result.stdout.strip():
+                boxes.append(('warning', "Warning", "No remote repository configured. Please configure a remote repository first."))
+                return boxes
+
+            # First, pull changes from remote
+            self.add_console_message("Pulling changes from remote repository...", "info")
+            # --quiet drops the progress stream, so capture_output holds
+            # a few error lines at most instead of buffering megabytes of
+            # transfer chatter
+            pull_result = subprocess.run(
+                ["git", "pull", "--quiet"],
+                cwd=project_path,
+                capture_output=True,
+                text=True,
+                encoding='utf-8',
+                errors='ignore'
+            )
+
+            if pull_result.returncode != 0:
+                # Handle pull errors (especially merge conflicts)
+                if "conflict" in pull_result.stderr.lower() or "conflict" in pull_result.stdout.lower():
+                    boxes.append(('critical', "Merge Conflict",
+                                  "Merge conflict detected during pull. Please resolve conflicts manually using Git tools."))
+                    self.add_console_message("Merge conflict detected during pull. Please resolve manually.", "error")
+                    return boxes
+                else:
+                    boxes.append(('warning', "Pull Warning", f"Failed to pull changes: {pull_result.stderr}"))
+                    self.add_console_message(f"Failed to pull changes: {pull_result.stderr}", "warning")
+
+            self.add_console_message("Pull completed successfully", "info")
+
+            # The dirty probe up front replaces the old add + status +
+            # commit trio on a clean tree, where all three were no-ops
+            if _git_tree_dirty(project_path):
                 # Stage all changes
                 subprocess.run(["git", "add", "."], cwd=project_path, capture_output=True)
-                
-                # Check if there are changes to commit
-                status_result = subprocess.run(
-                    ["git", "status", "--porcelain"], 
-                    cwd=project_path, 
-                    capture_output=True, 
-                    text=True,
-                    encoding='utf-8',
-                    errors='ignore'
-                )
-                
-                if status_result.stdout.strip():
-                    # Commit changes with a default message
-                    commit_result = subprocess.run(
-                        ["git", "commit", "-m", "Auto-commit before sync"], 
-                        cwd=project_path, 
-                        capture_output=True, 
-                        text=True,
-                        encoding='utf-8',
-                        errors='ignore'
-                    )
-                    
-                    if commit_result.returncode != 0 and "nothing to commit" not in commit_result.stderr:
-                        QMessageBox.warning(self, "Commit Warning", f"Failed to commit changes: {commit_result.stderr}")
-                        self.add_console_message(f"Failed to commit changes: {commit_result.stderr}", "warning")
-                
-                # Push changes to remote
-                self.add_console_message("Pushing changes to remote repository...", "info")
-                push_result = subprocess.run(
-                    ["git", "push", "origin", "HEAD"], 
-                    cwd=project_path, 
-                    capture_output=True, 
+
+                # Commit changes with a default message
+                commit_result = subprocess.run(
+                    ["git", "commit", "-m", "Auto-commit before sync"],
+                    cwd=project_path,
+                    capture_output=True,
                     text=True,
                     encoding='utf-8',
                     errors='ignore'
                 )
-                
-                if push_result.returncode == 0:
-                    QMessageBox.information(self, "Success", "Sync with remote repository completed successfully!")
-                    self.add_console_message("Push completed successfully", "info")
+
+                if commit_result.returncode != 0 and "nothing to commit" not in commit_result.stderr:
+                    boxes.append(('warning', "Commit Warning", f"Failed to commit changes: {commit_result.stderr}"))
+                    self.add_console_message(f"Failed to commit changes: {commit_result.stderr}", "warning")
+
+            # Push changes to remote
+            self.add_console_message("Pushing changes to remote repository...", "info")
+            # --porcelain gives machine-readable per-ref status lines on
+            # stdout, so failures are classified structurally instead of
+            # substring-matching locale-dependent stderr text
+            push_result = subprocess.run(
+                ["git", "push", "--porcelain", "origin", "HEAD"],
+                cwd=project_path,
+                capture_output=True,
+                text=True,
+                encoding='utf-8',
+                errors='ignore'
+            )
+
+            if push_result.returncode == 0:
+                boxes.append(('information', "Success", "Sync with remote repository completed successfully!"))
+                self.add_console_message("Push completed successfully", "info")
+            else:
+                # Exit 128 means the transport failed before any ref
+                # negotiation (auth, unreachable remote); a '!' status
+                # line marks a ref the remote rejected
+                rejected = any(line.startswith('!')
+                               for line in push_result.stdout.splitlines())
+                if push_result.returncode == 128:
+                    boxes.append(('critical', "Authentication Error",
+                                  "Could not reach or authenticate with the remote. Please check your SSH keys or credentials."))
+                elif rejected:
+                    boxes.append(('warning', "Push Rejected",
+                                  "Push was rejected. You may need to pull and merge changes first."))
                 else:
-                    # Handle common push errors
-                    error_output = push_result.stderr.lower()
-                    if "permission denied" in error_output or "authentication failed" in error_output:
-                        QMessageBox.critical(self, "Authentication Error", 
-                                           "Authentication failed. Please check your SSH keys or credentials.")
-                    elif "rejected" in error_output:
-                        QMessageBox.warning(self, "Push Rejected", 
-                                          "Push was rejected. You may need to pull and merge changes first.")
-                    else:
-                        QMessageBox.critical(self, "Push Error", f"Failed to push changes: {push_result.stderr}")
-                    self.add_console_message(f"Failed to push changes: {push_result.stderr}", "error")
-                    
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"An error occurred during sync: {str(e)}")
-                self.add_console_message(f"Sync error: {str(e)}", "error")
-        else:
-            QMessageBox.warning(self, "Warning", "No project selected")
+                    boxes.append(('critical', "Push Error", f"Failed to push changes: {push_result.stderr}"))
+                self.add_console_message(f"Failed to push changes: {push_result.stderr}", "error")
+
+            return boxes
+
+        def done(boxes):
+            self._syncing.discard(sync_key)
+            show = {'information': QMessageBox.information,
+                    'warning': QMessageBox.warning,
+                    'critical': QMessageBox.critical}
+            for severity, title, message in boxes:
+                show[severity](self, title, message)
+
+        def failed(msg):
+            self._syncing.discard(sync_key)
+            QMessageBox.critical(self, "Error", f"An error occurred during sync: {msg}")
+            self.add_console_message(f"Sync error: {msg}", "error")
+
+        self._run_git_async(work, done, on_error=failed)
 
     def show_volcano_plot(self):
         """Show volcano plot for differential analysis results"""
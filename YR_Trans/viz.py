@@ -1,11 +1,30 @@
 # Logistics of visualization datas
-from plotnine import *
+# plotnine (which drags in matplotlib) and scipy are imported inside the
+# plot functions: importing this module just to register menu entries
+# should not pay half a second of plotting-stack startup
+from functools import lru_cache
 import numpy as np
 import pandas as pd
-import scipy.stats as st
-import seaborn as sns
 import logging
 
+
+@lru_cache(maxsize=None)
+def _theme(name):
+    """Return the theme object for a name, built once per process
+
+    Re-renders (slider tweaks, color changes) used to instantiate all
+    ten theme objects per call and throw nine away; themes are inert
+    specs, so one instance per name can be reused across plots.
+    """
+    from plotnine import (theme_classic, theme_bw, theme_dark, theme_light,
+                          theme_minimal, theme_seaborn, theme_linedraw,
+                          theme_gray, theme_void, theme_xkcd)
+    factories = {'classic': theme_classic, 'bw': theme_bw, 'dark': theme_dark,
+                 'light': theme_light, 'minimal': theme_minimal,
+                 'seaborn': theme_seaborn, 'linedraw': theme_linedraw,
+                 'gray': theme_gray, 'void': theme_void, 'xkcd': theme_xkcd}
+    return factories[name]()
+
 def VolcanoPlot(data, 
                 GeneID=0, log2FC=1, pvalue=2, GeneName=None, 
                 theme = 'linedraw', 
@@ -14,46 +33,76 @@ def VolcanoPlot(data,
                 x_threshold=1, y_threshold=0.05, threshold_indicator=True, under_threshold_color=True, trimmode="none",
                 alt = True):
     # This function is originally written in the SuperVolcano plugin in YRTools v0.0.1
+    from plotnine import (ggplot, aes, geom_point, geom_vline, geom_hline,
+                          xlab, ylab, xlim, ylim, scale_color_manual,
+                          scale_color_cmap, scale_color_gradientn)
+    import scipy.stats as st
 
     # trimmode: "99hpd" / "95hpd" / "none" NOTE: abandoned
     # color_scheme: ['discrete', {'up': up_color, 'down': down_color, 'no-DEGs': no_DEGs_color}]
     # color_scheme: ['continuous', cmap]
     # in this case the color will be set based on (log2FC-x_threshold)*(-log10(pvalue)-y_threshold), namely a inverse proportional relationship
     # extract log2FC and pvalue
+    # Work on a local copy: the discrete branch adds legend keys to the
+    # color dict and the gradient branch appends limits to the list, so
+    # mutating the caller's (often the shared default argument's) object
+    # would accrete state across calls
+    color_scheme = list(color_scheme)
+    if color_scheme[0] == 'discrete':
+        color_scheme[1] = dict(color_scheme[1])
+
     log2FC_index = data.columns[log2FC]
     pvalue_index = data.columns[pvalue]
-    log2FC = data[log2FC_index]
-    pvalue = data[pvalue_index]
-    neg_log10_pvalue = -np.log10(pvalue)
-    plot_data = pd.DataFrame({"log2FC": log2FC, "-log10(Pvalue)": neg_log10_pvalue})
-
-    x_min = plot_data["log2FC"].min()
-    x_max = plot_data["log2FC"].max()
-    y_min = plot_data["-log10(Pvalue)"].min()
-    y_max = plot_data["-log10(Pvalue)"].max()
-    x_lim = max(abs(x_min), abs(x_max))
-    y_limup = y_max
+    # Pull the columns out as plain arrays once; every classification
+    # below runs on these instead of per-row pandas lookups. log2FC is
+    # fine in float32, but the p-values must stay float64 through the
+    # log: DESeq2 reaches 1e-100..1e-300, far below the ~1e-45 float32
+    # floor, and flushing those to zero would pin every top gene onto
+    # one clamped line
+    lfc_arr = data[log2FC_index].to_numpy().astype(np.float32, copy=False)
+    pv_arr = data[pvalue_index].to_numpy().astype(np.float64, copy=False)
+    # DESeq2 routinely emits NaN pvalue/log2FoldChange rows (Cook's
+    # cutoff, independent filtering); drop them up front so they neither
+    # poison the axis-limit reductions nor fall into a color category
+    # through NaN-comparison accidents
+    valid = ~(np.isnan(lfc_arr) | np.isnan(pv_arr))
+    if not valid.all():
+        lfc_arr = lfc_arr[valid]
+        pv_arr = pv_arr[valid]
+    # Clamp zero p-values so -log10 yields a large finite point instead
+    # of an infinity that breaks the axis limits; the -log10 result is
+    # a few hundred at most, so float32 downstream loses nothing
+    neg_log10_pvalue = (-np.log10(np.maximum(pv_arr, np.finfo(np.float64).tiny))
+                        ).astype(np.float32)
+    # The y threshold is compared against on the -log10 scale everywhere
+    y_thr_log = -np.log10(y_threshold)
+    plot_data = pd.DataFrame({"log2FC": lfc_arr, "-log10(Pvalue)": neg_log10_pvalue})
+
+    # Axis limits straight off the arrays: one |x| reduction replaces the
+    # min/max pair plus Python-level abs/max, and the y floor was never used
+    x_lim = float(np.nanmax(np.abs(lfc_arr)))
+    y_limup = float(np.nanmax(neg_log10_pvalue))
 
     # if trimmode == '99hpd':
     #     x_interval = st.norm.interval(0.99, loc=np.mean(plot_data["log2FC"]), scale=st.sem(plot_data["log2FC"]))
     #     x_lim = max(abs(x_interval[0]), abs(x_interval[1]))
 
     if color_scheme[0] == 'discrete':
-        cmap = []
-        stat = {"up":0, "down":0, "no-DEGs":0}
-        for i in range(len(plot_data)):
-            if data[pvalue_index][i] > y_threshold:
-                cmap.append("no-DEGs")
-                stat['no-DEGs'] += 1
-            elif abs(data[log2FC_index][i]) < x_threshold:
-                cmap.append("no-DEGs")
-                stat['no-DEGs'] += 1
-            elif data[log2FC_index][i] > 0:
-                cmap.append("up")
-                stat['up'] += 1
-            else:
-                cmap.append("down")
-                stat['down'] += 1
+        # Three boolean masks classify every gene in one C-level pass;
+        # mask order mirrors the old per-row if/elif chain
+        is_no = (pv_arr > y_threshold) | (np.abs(lfc_arr) < x_threshold)
+        is_up = ~is_no & (lfc_arr > 0)
+        is_down = ~(is_no | is_up)
+
+        # One byte of category code per row; plotnine only needs a
+        # categorical aesthetic, not N Python label strings
+        codes = np.select([is_up, is_down], [np.int8(0), np.int8(1)],
+                          default=np.int8(2))
+        # One bincount pass over the codes replaces three mask reductions
+        counts = np.bincount(codes, minlength=3)
+        stat = {"up": int(counts[0]),
+                "down": int(counts[1]),
+                "no-DEGs": int(counts[2])}
 
         ups_txt = "up"
         downs_txt = "down"
@@ -63,44 +112,38 @@ def VolcanoPlot(data,
             ups_txt = f"up {str(stat['up'])}"
             downs_txt = f"down {str(stat['down'])}"
             noDEGs_txt = f"no-DEGs {str(stat['no-DEGs'])}"
-        
-        cmap = [ups_txt if i == 'up' else i for i in cmap]
-        cmap = [downs_txt if i == 'down' else i for i in cmap]
-        cmap = [noDEGs_txt if i == 'no-DEGs' else i for i in cmap]
+
+        cmap = pd.Categorical.from_codes(
+            codes, categories=[ups_txt, downs_txt, noDEGs_txt])
         color_scheme[1][ups_txt] = color_scheme[1]['up']
         color_scheme[1][downs_txt] = color_scheme[1]['down']
         color_scheme[1][noDEGs_txt] = color_scheme[1]['no-DEGs']
         
         plot_data.insert(0, "cmap", cmap)
     if color_scheme[0] == 'cmap' or color_scheme[0] == 'gradient':
-        cmap = [ ]
-        stat = {"up":0, "down":0, "no-DEGs":0}
-        for i in range(len(plot_data)):
-            if under_threshold_color:
-                x_div = plot_data["log2FC"][i]
-                y_div = plot_data["-log10(Pvalue)"][i]
-            else:
-                if plot_data["log2FC"][i] > x_threshold or plot_data["log2FC"][i] < -x_threshold:
-                    x_div = plot_data["log2FC"][i]
-                else:
-                    x_div = 0
-                if plot_data["-log10(Pvalue)"][i] > -np.log10(y_threshold):
-                    y_div = plot_data["-log10(Pvalue)"][i]
-                else:
-                    y_div = 0
-            if y_div > -np.log10(y_threshold):
-                if x_div < -x_threshold:
-                    stat['down'] += 1
-                if x_div > x_threshold:
-                    stat['up'] += 1
-                else:
-                    stat['no-DEGs'] +=1
-            else:
-                stat['no-DEGs'] += 1
-            cmap.append(x_div * y_div)
+        # Whole-column arithmetic replaces the per-row loop; np.where
+        # zeroes the sub-threshold contributions in one pass
+        if under_threshold_color:
+            x_div = lfc_arr
+            y_div = neg_log10_pvalue
+        else:
+            x_div = np.where(np.abs(lfc_arr) > x_threshold, lfc_arr, 0)
+            y_div = np.where(neg_log10_pvalue > y_thr_log,
+                             neg_log10_pvalue, 0)
+
+        # Exclusive counts; the old loop's dangling else also counted
+        # down-regulated genes as no-DEGs
+        sig = y_div > y_thr_log
+        n_up = int((sig & (x_div > x_threshold)).sum())
+        n_down = int((sig & (x_div < -x_threshold)).sum())
+        stat = {"up": n_up, "down": n_down,
+                "no-DEGs": int(len(x_div) - n_up - n_down)}
+
+        cmap = x_div * y_div
         plot_data.insert(0, "cmap", cmap)
         # find the max value of cmap
-        color_scheme.append([-max(cmap), max(cmap)])
+        cmap_max = float(cmap.max())
+        color_scheme.append([-cmap_max, cmap_max])
 
         ups_txt = "up"
         downs_txt = "down"
@@ -114,16 +157,14 @@ def VolcanoPlot(data,
         if color_distribution_convert:
             # use normal distribution to determine the variance rate of cmap
             # 1. estimate distribution parameters
-            cmap = np.array(cmap, dtype=float)
-            mean = np.mean(cmap)
-            std = np.std(cmap)
-            # 2. use an approximate integral to estimate the area
-            cmap = plot_data["cmap"]
-            for i in range(len(cmap)):
-                cmap[i] = st.norm.cdf(cmap[i], mean, std)
+            mean = cmap.mean()
+            std = cmap.std()
+            # 2. one vectorized CDF call covers the whole column; SciPy
+            # broadcasts internally instead of N scalar calls
+            cmap = st.norm.cdf(cmap, mean, std)
             plot_data["cmap"] = cmap
-            maxx = max(cmap)
-            minx = min(cmap)
+            maxx = float(cmap.max())
+            minx = float(cmap.min())
             standard = st.norm.cdf(0, mean, std)
             color_scheme[2] =  [standard - max(maxx - standard, standard - minx), standard + max(maxx - standard, standard - minx)]
         
@@ -135,18 +176,16 @@ def VolcanoPlot(data,
         elif color_scheme[0] == 'gradient':
             return scale_color_gradientn(name='  ', colors=color_scheme[1], limits=color_scheme[2], breaks = [0, 0.5, 1], labels = [downs_txt, noDEGs_txt, ups_txt])
 
-    themes = {'classic': theme_classic(), 'bw': theme_bw(), 'dark': theme_dark(), 'light': theme_light(), 'minimal': theme_minimal(), 'seaborn': theme_seaborn(), 'linedraw': theme_linedraw(), 'gray': theme_gray(), 'void': theme_void(), 'xkcd': theme_xkcd()}
-
     def decideindicator(threshold_indicator):
         if threshold_indicator:
-            return [geom_vline(xintercept=x_threshold, color="black", linetype="dashed"), geom_vline(xintercept=-x_threshold, color="black", linetype="dashed"), geom_hline(yintercept=-np.log10(y_threshold), color="black", linetype="dashed")]
+            return [geom_vline(xintercept=x_threshold, color="black", linetype="dashed"), geom_vline(xintercept=-x_threshold, color="black", linetype="dashed"), geom_hline(yintercept=y_thr_log, color="black", linetype="dashed")]
         else:
             return None
 
     return (
         ggplot(data=plot_data, mapping=aes(x="log2FC", y="-log10(Pvalue)", color="cmap")) 
         + geom_point() 
-        + themes[theme]
+        + _theme(theme)
         + xlab("log2FC") 
         + ylab("-log10(Pvalue)")
         + xlim(-x_lim, x_lim)
@@ -156,16 +195,25 @@ def VolcanoPlot(data,
         # + theme(text=element_text(family='Times New Roman'))
     )
 
-def EnrichmentScatter(data, color_scheme=['gradient', ['#f57f74', '#82cc5e']], sorting = {'column':2, 'ascending': False}, 
-                vars = ['Rich Ratio', 'Pathway', "p-value", 'Gene Number'], theme_var=theme_bw()):
+def EnrichmentScatter(data, color_scheme=['gradient', ['#f57f74', '#82cc5e']], sorting = {'column':2, 'ascending': False},
+                vars = ['Rich Ratio', 'Pathway', "p-value", 'Gene Number'], theme_var=None):
     """
     vars[4]: x, y, scatter_color, scatter_size
                 ^  ^  ^              ^
     sorting  0  1  2              3
     """
+    from plotnine import (ggplot, aes, geom_point, scale_color_cmap,
+                          scale_color_gradientn, scale_size_continuous,
+                          theme, theme_bw)
+    # The old theme_bw() default ran at import time; None stands in so
+    # plotnine only loads when a plot is actually drawn
+    if theme_var is None:
+        theme_var = theme_bw()
     if sorting != None:
+        # The frame is already in sorted order after the in-place sort;
+        # re-sorting just to list the categories doubled the O(N log N) work
         data.sort_values(by=vars[sorting['column']], inplace=True, ascending=sorting['ascending'])
-        ordered_categories = data.sort_values(by=vars[sorting['column']], ascending=sorting['ascending'])[vars[1]].unique()
+        ordered_categories = data[vars[1]].unique()
         data[vars[1]] = pd.Categorical(
             data[vars[1]], 
             categories=ordered_categories,